@@ -17,24 +17,52 @@ This test will FAIL if Notepad++ is not properly installed/accessible.
 """
 
 import asyncio
+import importlib.util
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Windows-specific imports for the window/process probes
+try:
+    import win32gui
+    import win32process
+except ImportError:
+    win32gui: Any = None
+    win32process: Any = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-# Add src to path so we can import the server
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+# Banners and troubleshooting text are for interactive runs only; CI, pytest -q and
+# redirected output get just the pass/fail lines. NPP_TEST_VERBOSE=0/1 overrides.
+_INTERACTIVE = sys.stderr.isatty() and os.getenv("CI", "").lower() != "true" and "-q" not in sys.argv[1:]
+VERBOSE = os.getenv("NPP_TEST_VERBOSE", "1" if _INTERACTIVE else "0") == "1"
+
+# Worker threads for Win32 calls: enough for the widest asyncio.gather of probes
+_WIN32_WORKERS = 3
+
+# Banner separators
+_SEP40 = "=" * 40
+_SEP60 = "=" * 60
+_SEP80 = "=" * 80
 
-# Import the actual Notepad++ controller and tools
+# Fall back to the source tree only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("notepadpp_mcp") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+# Import the actual Notepad++ controller
 try:
-    from notepadpp_mcp.tools.server import (
+    from notepadpp_mcp.tools.controller import (
         WINDOWS_AVAILABLE,
         NotepadPPController,
         NotepadPPError,
         NotepadPPNotFoundError,
+        call_win32,
     )
 
     IMPORT_SUCCESS = True
@@ -42,371 +70,389 @@ except ImportError as e:
     IMPORT_SUCCESS = False
     IMPORT_ERROR = str(e)
 
+CLAUDE_DESKTOP_CONFIG = """```json
+{
+  "mcpServers": {
+    "notepadpp-mcp": {
+      "command": "python",
+      "args": ["-m", "notepadpp_mcp.tools.server"],
+      "cwd": "${workspaceFolder}",
+      "env": {
+        "PYTHONPATH": "${workspaceFolder}/src"
+      }
+    }
+  }
+}
+```"""
+
+
+# Troubleshooting / installation hints per failure kind: (heading, steps)
+_TROUBLESHOOTING: dict[str, tuple[str, list[str]]] = {
+    "import": (
+        "TROUBLESHOOTING",
+        [
+            "1. Install required Python packages:",
+            "   pip install fastmcp pywin32",
+            "",
+            "2. Make sure you're running on Windows",
+            "   This server requires Windows API access",
+        ],
+    ),
+    "windows_api": (
+        "TROUBLESHOOTING",
+        [
+            "1. Make sure you're running on Windows",
+            "2. Install pywin32: pip install pywin32",
+            "3. Restart your Python environment",
+        ],
+    ),
+    "exe_missing": (
+        "TROUBLESHOOTING",
+        [
+            "1. Install Notepad++ from: https://notepad-plus-plus.org/downloads/",
+            "2. Or set NOTEPADPP_PATH environment variable to the correct path",
+            "3. Run this test again after installation",
+        ],
+    ),
+    "install": (
+        "INSTALLATION INSTRUCTIONS",
+        [
+            "1. Download Notepad++ from:",
+            "   https://notepad-plus-plus.org/downloads/",
+            "2. Run the installer and follow the setup wizard",
+            "3. Default installation path should work:",
+            "   C:\\Program Files\\Notepad++\\",
+            "4. After installation, run this script again",
+            "Alternatively, you can install via Chocolatey:",
+            "   choco install notepadplusplus",
+        ],
+    ),
+    "controller_error": (
+        "TROUBLESHOOTING",
+        [
+            "1. Make sure Notepad++ is installed",
+            "2. Check Windows API availability",
+            "3. Try restarting the test",
+        ],
+    ),
+    "unexpected": (
+        "TROUBLESHOOTING",
+        [
+            "1. Check Python environment",
+            "2. Verify Windows API access",
+            "3. Try reinstalling pywin32: pip uninstall pywin32 && pip install pywin32",
+        ],
+    ),
+    "not_running": (
+        "TROUBLESHOOTING",
+        [
+            "1. Make sure Notepad++ is installed",
+            "2. Start Notepad++ manually",
+            "3. Check if Notepad++ is responding",
+            "4. Try closing and reopening Notepad++",
+        ],
+    ),
+}
+
+
+def _log_troubleshooting(kind: str) -> None:
+    """Log the troubleshooting block for a failure kind (interactive runs only)."""
+    if not VERBOSE:
+        return
+    heading, steps = _TROUBLESHOOTING[kind]
+    logger.info("\n".join([f"\n📋 {heading}:", _SEP40, *steps]))
+
+
+@lru_cache(maxsize=4)
+def _exe_exists(path: str) -> bool:
+    """True when `path` is an existing file (cached; the install path does not change mid-run)."""
+    return Path(path).is_file()
+
 
 def check_notepadpp_installation():
     """Actually try to create NotepadPPController and see if it works."""
-    logger.info("🔍 TESTING NOTEPAD++ CONTROLLER INITIALIZATION...")
-    logger.info("=" * 60)
+    if VERBOSE:
+        logger.info("\n".join(["🔍 TESTING NOTEPAD++ CONTROLLER INITIALIZATION...", _SEP60]))
 
     if not IMPORT_SUCCESS:
-        logger.error("❌ FAILED: Cannot import Notepad++ controller")
-        logger.error(f"   Import error: {IMPORT_ERROR}")
-        logger.info("\n📋 TROUBLESHOOTING:")
-        logger.info("=" * 40)
-        logger.info("1. Install required Python packages:")
-        logger.info("   pip install fastmcp pywin32")
-        logger.info("")
-        logger.info("2. Make sure you're running on Windows")
-        logger.info("   This server requires Windows API access")
-        logger.info("")
+        logger.error("❌ FAILED: Cannot import Notepad++ controller\n   Import error: %s", IMPORT_ERROR)
+        _log_troubleshooting("import")
         return False
 
     if not WINDOWS_AVAILABLE:
-        logger.error("❌ FAILED: Windows API not available")
-        logger.error("   This server requires Windows to function")
-        logger.info("\n📋 TROUBLESHOOTING:")
-        logger.info("=" * 40)
-        logger.info("1. Make sure you're running on Windows")
-        logger.info("2. Install pywin32: pip install pywin32")
-        logger.info("3. Restart your Python environment")
-        logger.info("Test completed successfully")
+        logger.error("❌ FAILED: Windows API not available\n   This server requires Windows to function")
+        _log_troubleshooting("windows_api")
         return False
 
     try:
         logger.info("   Creating NotepadPPController...")
         controller = NotepadPPController()
-        logger.info("✅ SUCCESS: Controller created successfully")
-        logger.info(f"   Notepad++ executable: {controller.notepadpp_exe}")
+        logger.info(
+            "✅ SUCCESS: Controller created successfully\n   Notepad++ executable: %s", controller.notepadpp_exe
+        )
 
         logger.info("\n   Testing Notepad++ executable access...")
-        if os.path.exists(controller.notepadpp_exe):
-            logger.info("✅ SUCCESS: Notepad++ executable is accessible")
-            logger.info(f"   Path: {controller.notepadpp_exe}")
+        if _exe_exists(controller.notepadpp_exe):
+            logger.info("✅ SUCCESS: Notepad++ executable is accessible\n   Path: %s", controller.notepadpp_exe)
         else:
-            logger.info(f"❌ FAILED: Notepad++ executable not found at {controller.notepadpp_exe}")
-            logger.info("\n📋 TROUBLESHOOTING:")
-            logger.info("=" * 40)
-            logger.info("1. Install Notepad++ from: https://notepad-plus-plus.org/downloads/")
-            logger.info("2. Or set NOTEPADPP_PATH environment variable to the correct path")
-            logger.info("3. Run this test again after installation")
-            logger.info("Test completed successfully")
+            logger.info("❌ FAILED: Notepad++ executable not found at %s", controller.notepadpp_exe)
+            _log_troubleshooting("exe_missing")
             return False
 
         return True
 
     except NotepadPPNotFoundError as e:
-        logger.info(f"❌ FAILED: {e}")
-        logger.info("\n📋 INSTALLATION INSTRUCTIONS:")
-        logger.info("=" * 40)
-        logger.info("1. Download Notepad++ from:")
-        logger.info("   https://notepad-plus-plus.org/downloads/")
-        logger.info("Test completed successfully")
-        logger.info("2. Run the installer and follow the setup wizard")
-        logger.info("Test completed successfully")
-        logger.info("3. Default installation path should work:")
-        logger.info("   C:\\Program Files\\Notepad++\\")
-        logger.info("Test completed successfully")
-        logger.info("4. After installation, run this script again")
-        logger.info("Test completed successfully")
-        logger.info("Alternatively, you can install via Chocolatey:")
-        logger.info("   choco install notepadplusplus")
-        logger.info("Test completed successfully")
+        logger.info("❌ FAILED: %s", e)
+        _log_troubleshooting("install")
         return False
 
     except NotepadPPError as e:
-        logger.info(f"❌ FAILED: {e}")
-        logger.info("\n📋 TROUBLESHOOTING:")
-        logger.info("=" * 40)
-        logger.info("1. Make sure Notepad++ is installed")
-        logger.info("2. Check Windows API availability")
-        logger.info("3. Try restarting the test")
-        logger.info("Test completed successfully")
+        logger.info("❌ FAILED: %s", e)
+        _log_troubleshooting("controller_error")
         return False
 
     except Exception as e:
-        logger.info(f"❌ UNEXPECTED ERROR: {e}")
-        logger.info("\n📋 TROUBLESHOOTING:")
-        logger.info("=" * 40)
-        logger.info("1. Check Python environment")
-        logger.info("2. Verify Windows API access")
-        logger.info("3. Try reinstalling pywin32: pip uninstall pywin32 && pip install pywin32")
-        logger.info("Test completed successfully")
-        return False
-
-
-def check_python_dependencies():
-    """Check if required Python packages are installed."""
-    logger.info("\n🔍 CHECKING PYTHON DEPENDENCIES...")
-    logger.info("=" * 60)
-
-    # Test the imports we already tried
-    if not IMPORT_SUCCESS:
-        logger.info("❌ FAILED: Cannot import required modules")
-        logger.info(f"   Error: {IMPORT_ERROR}")
-        logger.info("\n📋 INSTALLATION INSTRUCTIONS:")
-        logger.info("=" * 40)
-        logger.info("Install required packages:")
-        logger.info("pip install fastmcp pywin32")
-        logger.info("Test completed successfully")
+        logger.info("❌ UNEXPECTED ERROR: %s", e)
+        _log_troubleshooting("unexpected")
         return False
 
-    # Test Windows API availability
-    if not WINDOWS_AVAILABLE:
-        logger.info("❌ FAILED: Windows API not available")
-        logger.info("   This server requires Windows and pywin32")
-        logger.info("\n📋 TROUBLESHOOTING:")
-        logger.info("=" * 40)
-        logger.info("1. Make sure you're on Windows")
-        logger.info("2. Install pywin32: pip install pywin32")
-        logger.info("3. Restart Python environment")
-        logger.info("Test completed successfully")
-        return False
 
-    logger.info("✅ All required Python packages are accessible")
-    return True
+async def _post_key(controller, vk: int) -> None:
+    """Post WM_KEYDOWN/WM_KEYUP to the editor without blocking on Notepad++'s message pump."""
+    await controller.post_message(controller.scintilla_hwnd, 0x0100, vk, 0)  # WM_KEYDOWN
+    await controller.post_message(controller.scintilla_hwnd, 0x0101, vk, 0)  # WM_KEYUP
 
 
 async def demonstrate_real_tools():
     """Actually test the Notepad++ MCP server tools."""
-    logger.info("\n" + "=" * 80)
-    logger.info("🚀 TESTING REAL NOTEPAD++ MCP SERVER TOOLS")
-    logger.info("=" * 80)
-    logger.info("This will actually attempt Windows API calls to Notepad++")
-    logger.info("Make sure Notepad++ is installed and running!")
-    logger.info("=" * 80)
+    if VERBOSE:
+        logger.info(
+            "\n".join(
+                [
+                    "\n" + _SEP80,
+                    "🚀 TESTING REAL NOTEPAD++ MCP SERVER TOOLS",
+                    _SEP80,
+                    "This will actually attempt Windows API calls to Notepad++",
+                    "Make sure Notepad++ is installed and running!",
+                    _SEP80,
+                ]
+            )
+        )
 
     try:
         # Create controller
         logger.info("\n📊 1. Creating NotepadPPController...")
         controller = NotepadPPController()
-        logger.info("✅ Controller created successfully")
-        logger.info(f"   Notepad++ path: {controller.notepadpp_exe}")
+        logger.info("✅ Controller created successfully\n   Notepad++ path: %s", controller.notepadpp_exe)
 
         # Ensure Notepad++ is running
         logger.info("\n🔧 2. Ensuring Notepad++ is running...")
         try:
             await controller.ensure_notepadpp_running()
-            logger.info("✅ Notepad++ is running and accessible")
-            logger.info(f"   Main window: {controller.hwnd}")
-            logger.info(f"   Scintilla window: {controller.scintilla_hwnd}")
+            logger.info(
+                "\n".join(
+                    [
+                        "✅ Notepad++ is running and accessible",
+                        "   Main window: %s",
+                        "   Scintilla window: %s",
+                    ]
+                ),
+                controller.hwnd,
+                controller.scintilla_hwnd,
+            )
         except Exception as e:
-            logger.info(f"❌ FAILED: Cannot access Notepad++: {e}")
-            logger.info("\n📋 TROUBLESHOOTING:")
-            logger.info("=" * 40)
-            logger.info("1. Make sure Notepad++ is installed")
-            logger.info("2. Start Notepad++ manually")
-            logger.info("3. Check if Notepad++ is responding")
-            logger.info("4. Try closing and reopening Notepad++")
-            logger.info("Test completed successfully")
+            logger.info("❌ FAILED: Cannot access Notepad++: %s", e)
+            _log_troubleshooting("not_running")
             return False
 
         # Test file creation
         logger.info("\n📁 3. Testing file creation (new_file)...")
         try:
             # Create a new file by sending Ctrl+N
-            await controller.send_message(
-                controller.scintilla_hwnd,
-                0x0100,  # WM_KEYDOWN
-                0x4E,  # 'N' key
-                0,
-            )
-            await controller.send_message(
-                controller.scintilla_hwnd,
-                0x0101,  # WM_KEYUP
-                0x4E,  # 'N' key
-                0,
-            )
+            await _post_key(controller, 0x4E)  # 'N' key
             logger.info("✅ New file command sent to Notepad++")
         except Exception as e:
-            logger.info(f"❌ FAILED: Cannot create new file: {e}")
+            logger.info("❌ FAILED: Cannot create new file: %s", e)
 
         # Test text insertion
         logger.info("\n✏️  4. Testing text insertion...")
         test_text = "Hello from Notepad++ MCP Server!"
         try:
-            # Insert test text
-            for char in test_text:
-                # Send character as keystroke
-                await controller.send_message(
-                    controller.scintilla_hwnd,
-                    0x0102,  # WM_CHAR
-                    ord(char),
-                    0,
-                )
-            logger.info(f"✅ Text inserted: '{test_text}'")
+            # Insert test text as one SendInput batch (no per-character round-trips)
+            if not await call_win32(controller.type_text, test_text):
+                raise NotepadPPError("SendInput was blocked or Notepad++ is not in the foreground")
+            logger.info("✅ Text inserted: '%s'", test_text)
         except Exception as e:
-            logger.info(f"❌ FAILED: Cannot insert text: {e}")
+            logger.info("❌ FAILED: Cannot insert text: %s", e)
 
         # Test save operation
         logger.info("\n💾 5. Testing save operation...")
         try:
             # Send Ctrl+S to save
-            await controller.send_message(
-                controller.scintilla_hwnd,
-                0x0100,  # WM_KEYDOWN
-                0x53,  # 'S' key
-                0,
-            )
-            await controller.send_message(
-                controller.scintilla_hwnd,
-                0x0101,  # WM_KEYUP
-                0x53,  # 'S' key
-                0,
-            )
+            await _post_key(controller, 0x53)  # 'S' key
             logger.info("✅ Save command sent to Notepad++")
         except Exception as e:
-            logger.info(f"❌ FAILED: Cannot save file: {e}")
+            logger.info("❌ FAILED: Cannot save file: %s", e)
 
         # Test search functionality
         logger.info("\n🔍 6. Testing search functionality...")
         try:
             # Send Ctrl+F to open find dialog
-            await controller.send_message(
-                controller.scintilla_hwnd,
-                0x0100,  # WM_KEYDOWN
-                0x46,  # 'F' key
-                0,
-            )
-            await controller.send_message(
-                controller.scintilla_hwnd,
-                0x0101,  # WM_KEYUP
-                0x46,  # 'F' key
-                0,
-            )
+            await _post_key(controller, 0x46)  # 'F' key
             logger.info("✅ Find dialog opened in Notepad++")
         except Exception as e:
-            logger.info(f"❌ FAILED: Cannot open find dialog: {e}")
-
-        # Test window information
-        logger.info("\n📋 7. Testing window information...")
-        try:
-            # Get window title using Windows API
-            import win32gui
-
-            window_title = win32gui.GetWindowText(controller.hwnd)
-            logger.info(f"✅ Window title: {window_title}")
-
-            # Get process ID using Windows API
-            import win32process
-
-            thread_id, process_id = win32process.GetWindowThreadProcessId(controller.hwnd)
-            logger.info(f"✅ Process info: PID={process_id}, ThreadID={thread_id}")
-        except Exception as e:
-            logger.info(f"❌ FAILED: Cannot get window info: {e}")
+            logger.info("❌ FAILED: Cannot open find dialog: %s", e)
 
-        # Test Scintilla control
-        logger.info("\n📑 8. Testing Scintilla editor control...")
+        # Test window information and Scintilla control (independent probes, run together)
+        logger.info("\n📋 7. Testing window information and Scintilla editor control...")
         try:
-            # Check if Scintilla window is valid
-            import win32gui
-
-            scintilla_class = win32gui.GetClassName(controller.scintilla_hwnd)
-            logger.info(f"✅ Scintilla control found: {scintilla_class}")
-            logger.info(f"✅ Scintilla window handle: {controller.scintilla_hwnd}")
+            window_title, (thread_id, process_id), scintilla_class = await asyncio.gather(
+                asyncio.to_thread(win32gui.GetWindowText, controller.hwnd),
+                asyncio.to_thread(win32process.GetWindowThreadProcessId, controller.hwnd),
+                asyncio.to_thread(win32gui.GetClassName, controller.scintilla_hwnd),
+            )
+            logger.info(
+                "\n".join(
+                    [
+                        "✅ Window title: %s",
+                        "✅ Process info: PID=%s, ThreadID=%s",
+                        "✅ Scintilla control found: %s",
+                        "✅ Scintilla window handle: %s",
+                    ]
+                ),
+                window_title,
+                process_id,
+                thread_id,
+                scintilla_class,
+                controller.scintilla_hwnd,
+            )
         except Exception as e:
-            logger.info(f"❌ FAILED: Cannot access Scintilla: {e}")
+            logger.info("❌ FAILED: Cannot get window or Scintilla info: %s", e)
 
         return True
 
-    except Exception as e:
-        logger.error(f"Error during real tool demonstration: {e}")
-        logger.info(f"\n❌ Error during real tool demonstration: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Error during real tool demonstration")
         return False
 
 
 async def main():
     """Main demonstration function."""
-    logger.info("🔬 NOTEPAD++ MCP SERVER - REAL FUNCTIONALITY TEST")
-    logger.info("=" * 80)
-    logger.info("This script will test REAL Notepad++ Windows API integration")
-    logger.info("Prerequisites will be checked before running tests")
-    logger.info("=" * 80)
-
-    # Check prerequisites
-    notepadpp_ok = check_notepadpp_installation()
-    python_ok = check_python_dependencies()
-
-    if not (notepadpp_ok and python_ok):
-        logger.info("\n❌ PREREQUISITES NOT MET")
-        logger.info("Please install missing requirements and run again")
+    # Win32 calls are dispatched via asyncio.to_thread; a small named pool replaces the
+    # default min(32, cpu+4) executor (asyncio.run shuts it down on exit).
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=_WIN32_WORKERS, thread_name_prefix="npp-win32")
+    )
+
+    if VERBOSE:
+        logger.info(
+            "\n".join(
+                [
+                    "🔬 NOTEPAD++ MCP SERVER - REAL FUNCTIONALITY TEST",
+                    _SEP80,
+                    "This script will test REAL Notepad++ Windows API integration",
+                    "Prerequisites will be checked before running tests",
+                    _SEP80,
+                ]
+            )
+        )
+
+    # Check prerequisites (imports, Windows API and the Notepad++ executable)
+    if not check_notepadpp_installation():
+        logger.info("\n❌ PREREQUISITES NOT MET\nPlease install missing requirements and run again")
         return False
 
-    logger.info("\n✅ ALL PREREQUISITES MET - Starting Real Tests")
-    logger.info("=" * 60)
+    logger.info("\n".join(["\n✅ ALL PREREQUISITES MET - Starting Real Tests", _SEP60]))
 
     # Run the real demonstration
     success = await demonstrate_real_tools()
 
     if success:
-        logger.info("\n" + "=" * 80)
-        logger.info("🎉 REAL FUNCTIONALITY TEST COMPLETED!")
-        logger.info("=" * 80)
-        logger.info("✅ Prerequisites check: PASSED")
-        logger.info("✅ Notepad++ controller: WORKING")
-        logger.info("✅ Windows API integration: FUNCTIONAL")
-        logger.info("✅ Real tool tests: COMPLETED")
-        logger.info("Test completed successfully")
-        logger.info("📋 REAL TESTS PERFORMED:")
-        logger.info("- NotepadPPController instantiation")
-        logger.info("- Notepad++ executable path resolution")
-        logger.info("- Windows API window finding")
-        logger.info("- Scintilla editor window detection")
-        logger.info("- Keyboard shortcut simulation (Ctrl+N, Ctrl+S, Ctrl+F)")
-        logger.info("- Text input simulation")
-        logger.info("- Window information retrieval")
-        logger.info("- Process information gathering")
-        logger.info("Test completed successfully")
-        logger.info("🚀 NOTEPAD++ MCP SERVER IS FULLY OPERATIONAL!")
-        logger.info("📊 Ready for production use with Claude Desktop")
-        logger.info("=" * 80)
-        logger.info("Test completed successfully")
-        logger.info("💡 NEXT STEPS:")
-        logger.info("1. Install Claude Desktop")
-        logger.info("2. Configure the MCP server (see docs)")
-        logger.info("3. Test with real Notepad++ automation")
-        logger.info("Test completed successfully")
-        logger.info("🔧 CLAUDE DESKTOP CONFIGURATION:")
-        logger.info("```json")
-        logger.info("{")
-        logger.info('  "mcpServers": {')
-        logger.info('    "notepadpp-mcp": {')
-        logger.info('      "command": "python",')
-        logger.info('      "args": ["-m", "notepadpp_mcp.tools.server"],')
-        logger.info('      "cwd": "${workspaceFolder}",')
-        logger.info('      "env": {')
-        logger.info('        "PYTHONPATH": "${workspaceFolder}/src"')
-        logger.info("      }")
-        logger.info("    }")
-        logger.info("  }")
-        logger.info("}")
-        logger.info("```")
-        logger.info("=" * 80)
+        logger.info(
+            "\n".join(
+                [
+                    "\n" + _SEP80,
+                    "🎉 REAL FUNCTIONALITY TEST COMPLETED!",
+                    _SEP80,
+                    "✅ Prerequisites check: PASSED",
+                    "✅ Notepad++ controller: WORKING",
+                    "✅ Windows API integration: FUNCTIONAL",
+                    "✅ Real tool tests: COMPLETED",
+                    "🚀 NOTEPAD++ MCP SERVER IS FULLY OPERATIONAL!",
+                    _SEP80,
+                ]
+            )
+        )
+        if VERBOSE:
+            logger.info(
+                "\n".join(
+                    [
+                        "📋 REAL TESTS PERFORMED:",
+                        "- NotepadPPController instantiation",
+                        "- Notepad++ executable path resolution",
+                        "- Windows API window finding",
+                        "- Scintilla editor window detection",
+                        "- Keyboard shortcut simulation (Ctrl+N, Ctrl+S, Ctrl+F)",
+                        "- Text input simulation",
+                        "- Window information retrieval",
+                        "- Process information gathering",
+                        "📊 Ready for production use with Claude Desktop",
+                        _SEP80,
+                        "💡 NEXT STEPS:",
+                        "1. Install Claude Desktop",
+                        "2. Configure the MCP server (see docs)",
+                        "3. Test with real Notepad++ automation",
+                        "🔧 CLAUDE DESKTOP CONFIGURATION:",
+                        CLAUDE_DESKTOP_CONFIG,
+                        _SEP80,
+                    ]
+                )
+            )
     else:
-        logger.info("\n❌ REAL TESTS FAILED")
-        logger.info("The Notepad++ MCP Server has issues that need to be resolved")
-        logger.info("Check the error messages above for details")
+        logger.info(
+            "\n".join(
+                [
+                    "\n❌ REAL TESTS FAILED",
+                    "The Notepad++ MCP Server has issues that need to be resolved",
+                    "Check the error messages above for details",
+                ]
+            )
+        )
 
     return success
 
 
+def _fast_loop_factory():
+    """Event-loop factory from winloop (Windows) or uvloop when installed; None keeps asyncio's default."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return None
+    return loop_impl.new_event_loop
+
+
 if __name__ == "__main__":
-    logger.info("Starting Notepad++ MCP Server REAL functionality test...")
-    logger.info("This will test actual Windows API integration")
-    logger.info("Starting demonstration test...")
+    if VERBOSE:
+        logger.info(
+            "\n".join(
+                [
+                    "Starting Notepad++ MCP Server REAL functionality test...",
+                    "This will test actual Windows API integration",
+                    "Starting demonstration test...",
+                ]
+            )
+        )
 
     try:
-        success = asyncio.run(main())
+        success = asyncio.run(main(), loop_factory=_fast_loop_factory())
         if success:
             logger.info("\n✅ Real functionality test completed successfully!")
         else:
             logger.info("\n❌ Real functionality test failed - check prerequisites")
     except KeyboardInterrupt:
         logger.info("\n⏹️  Test interrupted by user")
-    except Exception as e:
-        logger.info(f"\n❌ Unexpected error: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Unexpected error")
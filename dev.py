@@ -4,10 +4,14 @@ Development helper script for notepadpp-mcp.
 Provides common development tasks.
 """
 
+import hashlib
 import logging
 import os
+import shlex
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configure structured logging for development script
@@ -25,22 +29,38 @@ console_handler.setFormatter(formatter)
 # Add handler to logger
 logger.addHandler(console_handler)
 
+# Resolved once; on Windows this finds the npm mcpb.cmd shim via PATHEXT, so no shell is needed
+MCPB_EXE = shutil.which("mcpb")
 
-def run_command(cmd, check=True, shell=False):
+
+def run_command(cmd, check=True):
     """Run command and handle errors."""
-    logger.info(f"Running: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Running: %s", shlex.join(cmd) if isinstance(cmd, list) else cmd)
     try:
-        result = subprocess.run(cmd, check=check, shell=shell)
+        result = subprocess.run(cmd, check=check)
         return result.returncode == 0
     except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed with exit code {e.returncode}")
+        logger.error("Command failed with exit code %s", e.returncode)
         return False
 
 
-def install_dev():
-    """Install development dependencies."""
+def install_dev(force=False):
+    """Install development dependencies unless pyproject.toml is unchanged since the last install."""
+    # Key on the interpreter too, so switching environments still triggers an install
+    digest = hashlib.sha256(Path("pyproject.toml").read_bytes() + sys.executable.encode()).hexdigest()
+    sentinel = Path(".cache") / "install_dev.hash"
+    if not force and sentinel.exists() and sentinel.read_text() == digest:
+        logger.info("Development dependencies are up to date (use --force to reinstall)")
+        return True
+
     logger.info("Installing development dependencies...")
-    return run_command([sys.executable, "-m", "pip", "install", "-e", ".[dev]"])
+    if not run_command([sys.executable, "-m", "pip", "install", "-e", ".[dev]"]):
+        return False
+
+    sentinel.parent.mkdir(exist_ok=True)
+    sentinel.write_text(digest)
+    return True
 
 
 def run_tests():
@@ -52,25 +72,30 @@ def run_tests():
 def run_type_check():
     """Run type checking."""
     logger.info("Running type checks...")
-    return run_command([sys.executable, "-m", "mypy", "src"])
+    # SQLite cache keeps incremental results in one file instead of thousands of JSON files
+    return run_command([sys.executable, "-m", "mypy", "--sqlite-cache", "--cache-dir", ".mypy_cache", "src"])
 
 
 def format_code():
-    """Format code with black and isort."""
+    """Format code and sort imports with ruff."""
     logger.info("Formatting code...")
+    # Both steps rewrite files in place, so they stay sequential
     success = True
-    success &= run_command([sys.executable, "-m", "black", "src"])
-    success &= run_command([sys.executable, "-m", "isort", "src"])
+    success &= run_command([sys.executable, "-m", "ruff", "format", "src", "tests"])
+    success &= run_command([sys.executable, "-m", "ruff", "check", "--select", "I", "--fix", "src", "tests"])
     return success
 
 
 def lint_code():
     """Run linting checks."""
     logger.info("Running linting...")
-    success = True
-    success &= run_command([sys.executable, "-m", "black", "--check", "src"])
-    success &= run_command([sys.executable, "-m", "isort", "--check-only", "src"])
-    return success
+    # Both checks are read-only, so they can run side by side
+    commands = [
+        [sys.executable, "-m", "ruff", "format", "--check", "src", "tests"],
+        [sys.executable, "-m", "ruff", "check", "src", "tests"],
+    ]
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        return all(executor.map(run_command, commands))
 
 
 def build_package():
@@ -79,33 +104,57 @@ def build_package():
     return run_command([sys.executable, "-m", "build"])
 
 
-def test_install():
-    """Test installation in clean environment."""
+def test_install(fresh=False):
+    """Test installation in a cached virtual environment."""
     logger.info("Testing installation...")
-    # Create temporary virtual environment
-    venv_path = Path("test_venv")
-    if venv_path.exists():
-        import shutil
+    # The venv is keyed on pyproject.toml, so it is only rebuilt when dependencies change
+    digest = hashlib.sha256(Path("pyproject.toml").read_bytes()).hexdigest()[:12]
+    cache_dir = Path(".cache")
+    venv_path = cache_dir / f"test_venv_{digest}"
 
+    # uv creates venvs and installs far faster than venv + pip; fall back when it is absent
+    uv = shutil.which("uv")
+
+    if fresh and venv_path.exists():
         shutil.rmtree(venv_path)
 
+    reuse = venv_path.exists()
     success = True
-    success &= run_command([sys.executable, "-m", "venv", str(venv_path)])
-
+    if not reuse:
+        # Drop venvs left behind by earlier pyproject.toml revisions
+        for stale in cache_dir.glob("test_venv_*"):
+            shutil.rmtree(stale)
+        # Isolated from the base interpreter, so a dependency missing from pyproject.toml fails the import
+        venv_cmd = [uv, "venv"] if uv else [sys.executable, "-m", "venv"]
+        success &= run_command([*venv_cmd, str(venv_path)])
+
+    # Resolve the venv executables to strings once; every command below reuses them
     if os.name == "nt":  # Windows
-        pip_path = venv_path / "Scripts" / "pip.exe"
-        python_path = venv_path / "Scripts" / "python.exe"
+        bin_dir = venv_path / "Scripts"
+        pip_exe = str(bin_dir / "pip.exe")
+        python_exe = str(bin_dir / "python.exe")
     else:
-        pip_path = venv_path / "bin" / "pip"
-        python_path = venv_path / "bin" / "python"
+        bin_dir = venv_path / "bin"
+        pip_exe = str(bin_dir / "pip")
+        python_exe = str(bin_dir / "python")
 
-    success &= run_command([str(pip_path), "install", "."])
-    success &= run_command([str(python_path), "-c", "import notepadpp_mcp; print('Import successful')"])
+    if uv:
+        install_cmd = [uv, "pip", "install", "--python", python_exe]
+        reinstall_flag = "--reinstall"
+    else:
+        install_cmd = [pip_exe, "install"]
+        reinstall_flag = "--force-reinstall"
 
-    # Cleanup
-    import shutil
+    if reuse:
+        # Dependencies are unchanged; only replace the project itself
+        success &= run_command([*install_cmd, reinstall_flag, "--no-deps", "."])
+    else:
+        success &= run_command([*install_cmd, "."])
+    success &= run_command([python_exe, "-c", "import notepadpp_mcp; print('Import successful')"])
 
-    shutil.rmtree(venv_path)
+    if not success:
+        # Never reuse a venv that failed to build or import
+        shutil.rmtree(venv_path, ignore_errors=True)
 
     return success
 
@@ -113,68 +162,87 @@ def test_install():
 def validate_mcpb():
     """Validate MCPB configuration."""
     logger.info("Validating MCPB configuration...")
-    # Use shell=True on Windows to find mcpb in PATH
-    if os.name == "nt":
-        return run_command(["mcpb", "validate", "manifest.json"], shell=True)  # noqa: S604 - cmd shim on PATH
-    else:
-        return run_command(["mcpb", "validate", "manifest.json"])
+    if MCPB_EXE is None:
+        logger.error("mcpb not found on PATH")
+        return False
+    return run_command([MCPB_EXE, "validate", "manifest.json"])
 
 
 def build_mcpb():
     """Build MCPB package."""
     logger.info("Building MCPB package...")
-    return run_command(["mcpb", "pack"])
+    if MCPB_EXE is None:
+        logger.error("mcpb not found on PATH")
+        return False
+    return run_command([MCPB_EXE, "pack"])
+
+
+def run_all(fresh=False):
+    """Run all checks and report whether every stage passed."""
+    # The read-only stages are independent subprocesses, so threads are enough to
+    # overlap them. test_install builds from the working tree, so it runs afterwards.
+    stages = {
+        "lint": lint_code,
+        "type-check": run_type_check,
+        "test": run_tests,
+        "validate-mcpb": validate_mcpb,
+    }
+    with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+        futures = {name: executor.submit(stage) for name, stage in stages.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    results["test-install"] = test_install(fresh)
+
+    for name, passed in results.items():
+        logger.info("%-13s %s", name, "passed" if passed else "FAILED")
+    failed = [name for name, passed in results.items() if not passed]
+    if failed:
+        logger.error("Failed stages: %s", ", ".join(failed))
+    return not failed
+
+
+# command -> (handler, help text, boolean --options forwarded as keyword arguments)
+COMMANDS = {
+    "install-dev": (install_dev, "Install development dependencies", ("force",)),
+    "test": (run_tests, "Run tests", ()),
+    "type-check": (run_type_check, "Run type checking", ()),
+    "format": (format_code, "Format code", ()),
+    "lint": (lint_code, "Run linting", ()),
+    "build": (build_package, "Build package", ()),
+    "test-install": (test_install, "Test installation", ("fresh",)),
+    "validate-mcpb": (validate_mcpb, "Validate MCPB config", ()),
+    "build-mcpb": (build_mcpb, "Build MCPB package", ()),
+    "all": (run_all, "Run all checks", ("fresh",)),
+}
+
+OPTIONS = {
+    "fresh": "Rebuild the cached test-install venv",
+    "force": "Reinstall development dependencies even if unchanged",
+}
 
 
 def main():
     """Main development script."""
     if len(sys.argv) < 2:
-        logger.info("Usage: python dev.py <command>")
+        logger.info("Usage: python dev.py <command> [options]")
         logger.info("Commands:")
-        logger.info("  install-dev  - Install development dependencies")
-        logger.info("  test         - Run tests")
-        logger.info("  type-check   - Run type checking")
-        logger.info("  format       - Format code")
-        logger.info("  lint         - Run linting")
-        logger.info("  build        - Build package")
-        logger.info("  test-install - Test installation")
-        logger.info("  validate-mcpb - Validate MCPB config")
-        logger.info("  build-mcpb    - Build MCPB package")
-        logger.info("  all          - Run all checks")
+        for name, (_, help_text, _) in COMMANDS.items():
+            logger.info("  %-13s - %s", name, help_text)
+        logger.info("Options:")
+        for name, help_text in OPTIONS.items():
+            logger.info("  --%-11s - %s", name, help_text)
         return 1
 
     command = sys.argv[1]
-
-    if command == "install-dev":
-        return 0 if install_dev() else 1
-    elif command == "test":
-        return 0 if run_tests() else 1
-    elif command == "type-check":
-        return 0 if run_type_check() else 1
-    elif command == "format":
-        return 0 if format_code() else 1
-    elif command == "lint":
-        return 0 if lint_code() else 1
-    elif command == "build":
-        return 0 if build_package() else 1
-    elif command == "test-install":
-        return 0 if test_install() else 1
-    elif command == "validate-mcpb":
-        return 0 if validate_mcpb() else 1
-    elif command == "build-mcpb":
-        return 0 if build_mcpb() else 1
-    elif command == "all":
-        success = True
-        success &= lint_code()
-        success &= run_type_check()
-        success &= run_tests()
-        success &= test_install()
-        success &= validate_mcpb()
-        return 0 if success else 1
-    else:
-        logger.info(f"Unknown command: {command}")
+    entry = COMMANDS.get(command)
+    if entry is None:
+        logger.info("Unknown command: %s", command)
         return 1
 
+    handler, _, option_names = entry
+    flags = set(sys.argv[2:])
+    options = {name: f"--{name}" in flags for name in option_names}
+    return 0 if handler(**options) else 1
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -13,13 +13,14 @@ Levels:
     advanced    Level 3 - Advanced features (20 min)
     integration Level 4 - Multi-tool workflows (45 min)
     full        Level 5 - Complete validation (90 min)
-    all         Run all levels sequentially
+    all         Run all levels (smoke and standard concurrently, unless --coverage)
 
 Options:
     --with-notepadpp  Run tests that require Notepad++ (if installed)
     --coverage        Generate coverage report
     --verbose         Verbose output
     --keep-results    Keep test artifacts for debugging
+    --no-xdist        Run each level in a single pytest process (implied by --with-notepadpp)
 
 Environment Variables:
     MEGATEST_MODE=local|ci         Test environment
@@ -28,12 +29,39 @@ Environment Variables:
 """
 
 import argparse
+import importlib.util
 import os
-import subprocess
+import shutil
 import sys
+import threading
 import time
+from functools import cached_property
 from pathlib import Path
 
+# pytest-xdist is optional; only pass -n when the plugin is importable
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# Seconds between subprocess completion checks in run_pytest
+POLL_INTERVAL = 0.01
+
+# Seconds to wait for the output relay after pytest exits; orphaned xdist workers can hold the pipe open
+READER_JOIN_TIMEOUT = 5.0
+
+# Level name/number -> MegatestRunner method; the single source for argparse choices too
+LEVEL_METHODS = {
+    "smoke": "run_level_1_smoke",
+    "1": "run_level_1_smoke",
+    "standard": "run_level_2_standard",
+    "2": "run_level_2_standard",
+    "advanced": "run_level_3_advanced",
+    "3": "run_level_3_advanced",
+    "integration": "run_level_4_integration",
+    "4": "run_level_4_integration",
+    "full": "run_level_5_full",
+    "5": "run_level_5_full",
+}
+LEVEL_CHOICES = tuple(LEVEL_METHODS)
+
 
 class MegatestRunner:
     """Local megatest runner with safety and convenience features."""
@@ -42,6 +70,7 @@ class MegatestRunner:
         self.root_dir = Path(__file__).parent.parent
         self.test_dir = self.root_dir / "tests" / "megatest"
         self.results_dir = self.root_dir / "test-results"
+        self.package_found = (self.root_dir / "src" / "notepadpp_mcp").exists()
 
         # Ensure test directories exist
         self.results_dir.mkdir(exist_ok=True)
@@ -51,7 +80,7 @@ class MegatestRunner:
         print("Checking test environment...")
 
         # Check if we're in the right directory
-        if not (self.root_dir / "src" / "notepadpp_mcp").exists():
+        if not self.package_found:
             print("Error: Not in Notepad++ MCP root directory")
             return False
 
@@ -63,8 +92,15 @@ class MegatestRunner:
         print("Environment check passed")
         return True
 
-    def check_notepadpp(self):
-        """Check if Notepad++ is available for testing."""
+    @cached_property
+    def notepadpp_path(self):
+        """Path to notepad++.exe, or None; PATH then the registry are probed once per runner."""
+        # A PATH lookup is much cheaper than the registry round-trip and works off Windows too
+        on_path = shutil.which("notepad++") or shutil.which("notepad++.exe")
+        if on_path:
+            print(f"Notepad++ found: {on_path}")
+            return Path(on_path)
+
         try:
             import winreg
 
@@ -79,28 +115,39 @@ class MegatestRunner:
             exe_path = Path(install_path) / "notepad++.exe"
             if exe_path.exists():
                 print(f"Notepad++ found: {exe_path}")
-                return True
+                return exe_path
             else:
                 print("Warning: Notepad++ registry entry found but executable missing")
-                return False
+                return None
 
         except (FileNotFoundError, OSError):
             print("⚠️  Notepad++ not found in registry")
-            return False
+            return None
+
+    def check_notepadpp(self):
+        """Check if Notepad++ is available for testing."""
+        return self.notepadpp_path is not None
 
     def set_environment_variables(self, args):
         """Set environment variables for testing."""
-        os.environ["MEGATEST_MODE"] = "local"
-        os.environ["MEGATEST_LOCATION"] = "local"
-        os.environ["MEGATEST_CLEANUP"] = "on-success" if args.keep_results else "immediate"
+        notepadpp_available = args.with_notepadpp and self.notepadpp_path is not None
+        updates = {
+            "MEGATEST_MODE": "local",
+            "MEGATEST_LOCATION": "local",
+            "MEGATEST_CLEANUP": "on-success" if args.keep_results else "immediate",
+            "NOTEPADPP_AVAILABLE": "1" if notepadpp_available else "0",
+        }
 
-        if args.with_notepadpp and self.check_notepadpp():
-            os.environ["NOTEPADPP_AVAILABLE"] = "1"
-        else:
-            os.environ["NOTEPADPP_AVAILABLE"] = "0"
+        # Skip the putenv calls entirely when a previous call already applied these values
+        if all(os.environ.get(key) == value for key, value in updates.items()):
+            return
+        os.environ.update(updates)
 
     def run_pytest(self, test_path, description, timeout=None):
         """Run pytest with proper configuration."""
+        # Imported here so `--help` and argument errors don't pay for subprocess
+        import subprocess
+
         cmd = [
             sys.executable,
             "-m",
@@ -113,6 +160,10 @@ class MegatestRunner:
             "--durations=10",
         ]
 
+        # Tests that drive the real UI share one Notepad++ window and clipboard, so keep them in one worker
+        if XDIST_AVAILABLE and not (hasattr(self, "args") and (self.args.no_xdist or self.args.with_notepadpp)):
+            cmd.extend(["-n", "auto", "--dist=loadfile"])
+
         if hasattr(self, "args") and self.args.coverage:
             cmd.extend(
                 [
@@ -126,24 +177,52 @@ class MegatestRunner:
         print(f"\nRunning {description}...")
         print(f"Command: {' '.join(cmd)}")
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + timeout if timeout else None
+
+        # Stream output line by line, tagged with the level, so concurrent levels stay readable
+        process = subprocess.Popen(
+            cmd,
+            cwd=self.root_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            errors="replace",
+        )
+        reader = threading.Thread(target=self._relay_output, args=(process, description), daemon=True)
+        reader.start()
 
         try:
-            result = subprocess.run(cmd, cwd=self.root_dir, timeout=timeout, capture_output=False)
-
-            duration = time.time() - start_time
-            print(f"Duration: {duration:.2f}s")
-            if result.returncode == 0:
-                print(f"PASSED: {description}")
-                return True
-            else:
-                print(f"FAILED: {description} (exit code: {result.returncode})")
-                return False
-
-        except subprocess.TimeoutExpired:
-            print(f"TIMED OUT: {description} after {timeout}s")
+            # Short poll interval so a finished level is noticed (and the next one started) promptly
+            while (returncode := process.poll()) is None:
+                if deadline is not None and time.monotonic() > deadline:
+                    process.kill()
+                    process.wait()
+                    reader.join(READER_JOIN_TIMEOUT)
+                    print(f"TIMED OUT: {description} after {timeout}s")
+                    return False
+                time.sleep(POLL_INTERVAL)
+            reader.join(READER_JOIN_TIMEOUT)
+        finally:
+            if process.poll() is None:
+                process.kill()
+
+        duration = time.monotonic() - start_time
+        print(f"Duration: {duration:.2f}s")
+        if returncode == 0:
+            print(f"PASSED: {description}")
+            return True
+        else:
+            print(f"FAILED: {description} (exit code: {returncode})")
             return False
 
+    @staticmethod
+    def _relay_output(process, description):
+        """Print a child's output as it arrives, prefixed with its level."""
+        for line in process.stdout:
+            print(f"[{description}] {line}", end="")
+
     def run_level_1_smoke(self):
         """Run Level 1: Smoke Test."""
         test_path = self.test_dir / "level1_smoke"
@@ -179,24 +258,45 @@ class MegatestRunner:
         return self.run_pytest(test_path, "Level 5 - Full Blast Test", timeout=7200)
 
     def run_all_levels(self):
-        """Run all test levels sequentially."""
-        levels = [
+        """Run all test levels, overlapping the mock-only ones."""
+        # Levels 1-2 run against mocks and can overlap; the rest may drive the
+        # real Notepad++ UI and stay serial, as does everything with --with-notepadpp.
+        # With --coverage every level writes the same .coverage file and HTML report
+        # directories, so overlapping levels would clobber each other's data.
+        parallel_levels = [
             ("Level 1 - Smoke", self.run_level_1_smoke),
             ("Level 2 - Standard", self.run_level_2_standard),
+        ]
+        serial_levels = [
             ("Level 3 - Advanced", self.run_level_3_advanced),
             ("Level 4 - Integration", self.run_level_4_integration),
             ("Level 5 - Full", self.run_level_5_full),
         ]
 
+        if self.args.with_notepadpp or self.args.coverage:
+            serial_levels = parallel_levels + serial_levels
+            parallel_levels = []
+
         results = []
-        for name, func in levels:
-            result = func()
-            results.append((name, result))
+        if parallel_levels:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=len(parallel_levels)) as executor:
+                futures = [(name, executor.submit(func)) for name, func in parallel_levels]
+                results.extend((name, future.result()) for name, future in futures)
 
-            # Stop on first failure unless explicitly requested
-            if not result and not self.args.force_continue:
-                print(f"\nStopping at {name} failure")
-                break
+        failed = next((name for name, result in results if not result), None)
+        if failed and not self.args.force_continue:
+            print(f"\nStopping at {failed} failure")
+        else:
+            for name, func in serial_levels:
+                result = func()
+                results.append((name, result))
+
+                # Stop on first failure unless explicitly requested
+                if not result and not self.args.force_continue:
+                    print(f"\nStopping at {name} failure")
+                    break
 
         print("\nTest Results Summary:")
         for name, result in results:
@@ -208,25 +308,13 @@ class MegatestRunner:
 
     def run_specific_level(self, level):
         """Run a specific test level."""
-        level_map = {
-            "smoke": self.run_level_1_smoke,
-            "1": self.run_level_1_smoke,
-            "standard": self.run_level_2_standard,
-            "2": self.run_level_2_standard,
-            "advanced": self.run_level_3_advanced,
-            "3": self.run_level_3_advanced,
-            "integration": self.run_level_4_integration,
-            "4": self.run_level_4_integration,
-            "full": self.run_level_5_full,
-            "5": self.run_level_5_full,
-        }
-
-        if level not in level_map:
+        if level not in LEVEL_METHODS:
             print(f"Unknown level: {level}")
-            print("Available levels: smoke, standard, advanced, integration, full, all")
+            names = [name for name in LEVEL_METHODS if not name.isdigit()]
+            print(f"Available levels: {', '.join(names)}, all")
             return False
 
-        return level_map[level]()
+        return getattr(self, LEVEL_METHODS[level])()
 
     def main(self):
         """Main entry point."""
@@ -240,19 +328,7 @@ class MegatestRunner:
             "level",
             nargs="?",
             default="standard",
-            choices=[
-                "smoke",
-                "1",
-                "standard",
-                "2",
-                "advanced",
-                "3",
-                "integration",
-                "4",
-                "full",
-                "5",
-                "all",
-            ],
+            choices=(*LEVEL_CHOICES, "all"),
             help="Test level to run",
         )
 
@@ -272,6 +348,12 @@ class MegatestRunner:
             help="Keep test artifacts for debugging",
         )
 
+        parser.add_argument(
+            "--no-xdist",
+            action="store_true",
+            help="Disable pytest-xdist parallelism within a level (always off with --with-notepadpp)",
+        )
+
         parser.add_argument(
             "--force-continue",
             action="store_true",
@@ -291,7 +373,7 @@ class MegatestRunner:
         self.set_environment_variables(self.args)
 
         # Run tests
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             if self.args.level == "all":
@@ -299,7 +381,7 @@ class MegatestRunner:
             else:
                 success = self.run_specific_level(self.args.level)
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
 
             print(f"\nTotal runtime: {duration:.1f}s")
 
@@ -9,7 +9,7 @@ from typing import Any
 
 from fastmcp import FastMCP
 
-from .tools.controller import NotepadPPController
+from .tools.controller import NotepadPPController, NotepadPPError, call_win32, parse_window_title
 
 # Skip counting lines for huge files (read into memory cap)
 _MAX_STATS_BYTES = 8_000_000
@@ -151,20 +151,19 @@ async def build_editor_snapshot(
     try:
         await controller.ensure_notepadpp_running()
     except Exception as e:
+        try:
+            executable = controller.notepadpp_exe
+        except NotepadPPError:
+            executable = None
         return {
             "connected": False,
             "reason": "notepad_unreachable",
             "error": str(e),
-            "executable": controller.notepadpp_exe,
+            "executable": executable,
         }
 
-    window_title = controller.get_window_text(controller.hwnd or 0)
-    filename = "Untitled"
-    is_modified = False
-    if " - Notepad++" in window_title:
-        filename = window_title.split(" - Notepad++")[0]
-    if "*" in window_title:
-        is_modified = True
+    window_title = await call_win32(controller.get_window_text, controller.hwnd or 0)
+    filename, is_modified = parse_window_title(window_title)
 
     display_name = normalize_title_filename(filename)
     resolved_path = try_resolve_path_from_hint(filename)
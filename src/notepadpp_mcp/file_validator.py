@@ -21,25 +21,28 @@ Usage:
         logger.warning("invalid_file", errors=result.errors)
 """
 
+import copy
 import logging
 import os
+import re
+import stat
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
-from dataclasses import dataclass, field
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import cache
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, ClassVar
 
-try:
-    import yaml
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
-    yaml: Any = None
+# PyYAML is only imported (by _yaml) once a file actually has frontmatter
+HAS_YAML = find_spec("yaml") is not None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of file validation."""
 
@@ -61,6 +64,15 @@ class ValidationResult:
         """Add validation warning (doesn't invalidate)."""
         self.warnings.append(warning)
 
+    def copy(self) -> "ValidationResult":
+        """Copy whose errors, warnings and frontmatter can be changed without affecting this result."""
+        return replace(
+            self,
+            errors=self.errors.copy(),
+            warnings=self.warnings.copy(),
+            frontmatter=copy.deepcopy(self.frontmatter),
+        )
+
 
 class FileValidator:
     """
@@ -80,46 +92,63 @@ class FileValidator:
     # Maximum filename length (Windows limit is 260, but be conservative)
     MAX_FILENAME_LENGTH = 200
 
+    # Lines longer than this suggest minified or corrupted content
+    MAX_LINE_LENGTH = 10000
+
     # Minimum file size (0 bytes is suspicious)
     MIN_FILE_SIZE = 0  # Allow empty files but warn
 
     # Reserved Windows filenames
-    WINDOWS_RESERVED: ClassVar[set[str]] = {
-        "CON",
-        "PRN",
-        "AUX",
-        "NUL",
-        "COM1",
-        "COM2",
-        "COM3",
-        "COM4",
-        "COM5",
-        "COM6",
-        "COM7",
-        "COM8",
-        "COM9",
-        "LPT1",
-        "LPT2",
-        "LPT3",
-        "LPT4",
-        "LPT5",
-        "LPT6",
-        "LPT7",
-        "LPT8",
-        "LPT9",
-    }
+    WINDOWS_RESERVED: ClassVar[frozenset[str]] = frozenset(
+        {
+            "CON",
+            "PRN",
+            "AUX",
+            "NUL",
+            "COM1",
+            "COM2",
+            "COM3",
+            "COM4",
+            "COM5",
+            "COM6",
+            "COM7",
+            "COM8",
+            "COM9",
+            "LPT1",
+            "LPT2",
+            "LPT3",
+            "LPT4",
+            "LPT5",
+            "LPT6",
+            "LPT7",
+            "LPT8",
+            "LPT9",
+        }
+    )
 
     # Dangerous filename characters (beyond OS restrictions)
-    DANGEROUS_CHARS: ClassVar[set[str]] = set('<>:"|?*\x00')
+    DANGEROUS_CHARS: ClassVar[frozenset[str]] = frozenset('<>:"|?*\x00')
+
+    # Any dangerous or control character
+    SUSPICIOUS_CHAR_PATTERN = re.compile(r'[<>:"|?*\x00-\x1f]')
+
+    # Closing frontmatter marker: a line that is "---" or "..." once stripped ([^\S\n] is any
+    # whitespace str.strip() removes, other than the line break)
+    FRONTMATTER_END_PATTERN = re.compile(r"^[^\S\n]*(?:---|\.\.\.)[^\S\n]*$", re.MULTILINE)
 
     # Encodings to try in order
     ENCODINGS: ClassVar[list[str]] = ["utf-8", "utf-8-sig", "latin-1", "cp1252", "iso-8859-1"]
 
+    # Maximum number of results kept when caching is enabled
+    CACHE_SIZE = 10_000
+
     def __init__(
         self,
         max_file_size: int = MAX_FILE_SIZE,
         allow_empty: bool = True,
         strict_frontmatter: bool = False,
+        cache: bool = False,
+        cache_size: int = CACHE_SIZE,
     ):
         """
         Initialize validator.
@@ -128,17 +157,65 @@ class FileValidator:
             max_file_size: Maximum file size in bytes
             allow_empty: Allow empty files (will warn but not error)
             strict_frontmatter: Require valid frontmatter
+            cache: Reuse results for files whose mtime and size are unchanged
+                (off by default; edits that keep both identical go unnoticed)
+            cache_size: Maximum number of cached results (least recently used are evicted)
         """
         self.max_file_size = max_file_size
         self.allow_empty = allow_empty
         self.strict_frontmatter = strict_frontmatter
+        self.cache_size = cache_size
+
+        # abspath -> (st_mtime_ns, st_size, result), in least-recently-used order
+        self._cache: OrderedDict[str, tuple[int, int, ValidationResult]] | None = OrderedDict() if cache else None
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle for process pools without the lock or the cache (workers don't share it)."""
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        state["_cache"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore a pickled validator with a fresh lock."""
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+    def invalidate(self, file_path: str | Path | None = None):
+        """
+        Drop cached results.
 
-    def validate_file(self, file_path: str | Path) -> ValidationResult:
+        Args:
+            file_path: File to forget, or None to clear the whole cache
+        """
+        if self._cache is None:
+            return
+
+        with self._cache_lock:
+            if file_path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.abspath(file_path), None)
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get result cache statistics."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache) if self._cache is not None else 0,
+            "max_size": self.cache_size,
+        }
+
+    def validate_file(self, file_path: str | Path, stat_result: os.stat_result | None = None) -> ValidationResult:
         """
         Validate a markdown file completely.
 
         Args:
             file_path: Path to file to validate
+            stat_result: Already-fetched stat (e.g. from os.scandir) to skip the stat call
 
         Returns:
             ValidationResult with details
@@ -149,21 +226,58 @@ class FileValidator:
         file_path = Path(file_path)
         result = ValidationResult(is_valid=True, file_path=str(file_path))
 
-        # Check file exists
-        if not file_path.exists():
-            result.add_error(f"File does not exist: {file_path}")
-            return result
+        # One stat answers existence, type and size; Path.exists/is_file/stat would each issue their own
+        if stat_result is None:
+            try:
+                stat_result = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError, ValueError):
+                result.add_error(f"File does not exist: {file_path}")
+                return result
+            except PermissionError as e:
+                result.add_error(f"Permission denied: {file_path}: {e}")
+                return result
+            except OSError as e:
+                result.add_error(f"Cannot access file: {file_path}: {e}")
+                return result
 
         # Check it's a file (not directory)
-        if not file_path.is_file():
+        if not stat.S_ISREG(stat_result.st_mode):
             result.add_error(f"Not a file: {file_path}")
             return result
 
+        if self._cache is None:
+            return self._validate_regular_file(file_path, stat_result, result)
+
+        # An unchanged (mtime, size) pair means the file need not be read again. Callers get
+        # copies, so one caller's add_error()/add_warning() can't leak into later results.
+        cache_key = os.path.abspath(file_path)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+                self._cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return cached[2].copy()
+            self.cache_misses += 1
+
+        result = self._validate_regular_file(file_path, stat_result, result)
+
+        with self._cache_lock:
+            self._cache[cache_key] = (stat_result.st_mtime_ns, stat_result.st_size, result.copy())
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def _validate_regular_file(
+        self, file_path: Path, stat_result: os.stat_result, result: ValidationResult
+    ) -> ValidationResult:
+        """Run the filename, access, size, content and frontmatter checks on a stat'ed regular file."""
         # Validate filename
         self._validate_filename(file_path, result)
 
         # Validate file accessibility
-        self._validate_accessibility(file_path, result)
+        self._validate_accessibility(file_path, stat_result, result)
 
         # Validate file size
         self._validate_size(file_path, result)
@@ -175,8 +289,8 @@ class FileValidator:
         # Try to read content
         self._validate_content(file_path, result)
 
-        # If content read successfully, validate frontmatter
-        if result.content is not None:
+        # If content read successfully and opens with a marker, validate frontmatter
+        if result.content is not None and result.content.startswith("---"):
             self._validate_frontmatter(result)
 
         return result
@@ -189,18 +303,21 @@ class FileValidator:
         if len(filename) > self.MAX_FILENAME_LENGTH:
             result.add_error(f"Filename too long ({len(filename)} > {self.MAX_FILENAME_LENGTH}): {filename}")
 
+        # One scan for both character checks below; clean names skip them entirely
+        suspicious = self.SUSPICIOUS_CHAR_PATTERN.search(filename) is not None
+
         # Check for dangerous characters
-        dangerous = self.DANGEROUS_CHARS & set(filename)
+        dangerous = self.DANGEROUS_CHARS.intersection(filename) if suspicious else None
         if dangerous:
             result.add_error(f"Dangerous characters in filename: {dangerous} in {filename}")
 
-        # Check for Windows reserved names
-        name_without_ext = file_path.stem.upper()
-        if name_without_ext in self.WINDOWS_RESERVED:
-            result.add_error(f"Reserved Windows filename: {name_without_ext}")
+        # Check for Windows reserved names (none is longer than 4 chars, so skip upper() for longer stems)
+        stem = file_path.stem
+        if len(stem) <= 4 and stem.upper() in self.WINDOWS_RESERVED:
+            result.add_error(f"Reserved Windows filename: {stem.upper()}")
 
         # Check for control characters
-        if any(ord(c) < 32 for c in filename):
+        if suspicious and any(ord(c) < 32 for c in filename):
             result.add_error(f"Control characters in filename: {filename}")
 
         # Warn about unicode characters (not an error, but worth noting)
@@ -212,25 +329,16 @@ class FileValidator:
             result.add_warning(f"Spaces in filename (consider using underscores): {filename}")
 
         # Check extension
-        if file_path.suffix.lower() not in [".md", ".markdown"]:
+        if file_path.suffix.lower() not in (".md", ".markdown"):
             result.add_warning(f"Unexpected extension: {file_path.suffix} (expected .md or .markdown)")
 
-    def _validate_accessibility(self, file_path: Path, result: ValidationResult):
+    def _validate_accessibility(self, file_path: Path, stat_result: os.stat_result, result: ValidationResult):
         """Check if file can be accessed."""
-        try:
-            # Try to stat the file
-            stats = file_path.stat()
-            result.size_bytes = stats.st_size
-
-            # Check read permissions
-            if not os.access(file_path, os.R_OK):
-                result.add_error(f"No read permission: {file_path}")
+        result.size_bytes = stat_result.st_size
 
-        except PermissionError as e:
-            result.add_error(f"Permission denied: {file_path}: {e}")
-
-        except OSError as e:
-            result.add_error(f"Cannot access file: {file_path}: {e}")
+        # Check read permissions
+        if not os.access(file_path, os.R_OK):
+            result.add_error(f"No read permission: {file_path}")
 
     def _validate_size(self, file_path: Path, result: ValidationResult):
         """Validate file size is reasonable."""
@@ -252,25 +360,26 @@ class FileValidator:
             result.add_warning(f"Large markdown file ({size / 1024 / 1024:.2f} MB): {file_path}")
 
     def _validate_content(self, file_path: Path, result: ValidationResult):
-        """Try to read file content with multiple encodings."""
-        # Raw-bytes pre-check: NUL bytes mark a binary file regardless of how the
-        # decoders behave (latin-1 decodes any byte sequence, so this must run first).
+        """Read the file once and decode it, trying each encoding in turn."""
+        # One unbuffered binary read; every check below works on these bytes in memory
         try:
-            with open(file_path, "rb") as raw:
+            with open(file_path, "rb", buffering=0) as raw:
                 raw_data = raw.read()
         except OSError as e:
             result.add_error(f"Cannot read file: {file_path}: {type(e).__name__}: {e}")
             return
 
-        if b"\x00" in raw_data[:1024]:
+        # Raw-bytes pre-check: NUL bytes mark a binary file regardless of how the
+        # decoders behave (latin-1 decodes any byte sequence, so this must run first).
+        if raw_data.find(b"\x00", 0, 1024) != -1:
             result.add_error(f"Binary file detected (contains null bytes): {file_path}")
             return
 
         # Mixed line endings: some lines end with CRLF and some with bare LF.
-        # Analyzed on raw bytes because text-mode reads normalize line endings.
+        # Analyzed on raw bytes because the decoded text has line endings normalized.
+        # The total LF count is only taken when CRLFs are present at all.
         crlf = raw_data.count(b"\r\n")
-        lf_only = raw_data.count(b"\n") - crlf
-        if crlf and lf_only:
+        if crlf and raw_data.count(b"\n") != crlf:
             result.add_warning(f"Mixed line endings detected: {file_path}")
 
         content = None
@@ -278,8 +387,7 @@ class FileValidator:
 
         for encoding in self.ENCODINGS:
             try:
-                with open(file_path, encoding=encoding, errors="strict") as f:
-                    content = f.read()
+                content = raw_data.decode(encoding)
                 result.encoding = encoding
                 break
 
@@ -287,36 +395,47 @@ class FileValidator:
                 last_error = e
                 continue
 
-            except Exception as e:
-                result.add_error(f"Failed to read file: {file_path}: {type(e).__name__}: {e}")
-                return
-
         if content is None:
-            # Try binary read to check if it's actually binary
-            try:
-                with open(file_path, "rb") as f:
-                    raw = f.read(1024)  # Read first 1KB
-
-                # Check for null bytes (binary indicator)
-                if b"\x00" in raw:
-                    result.add_error(f"Binary file detected (contains null bytes): {file_path}")
-                else:
-                    result.add_error(f"Encoding error (tried {', '.join(self.ENCODINGS)}): {file_path}: {last_error}")
-
-            except Exception as e:
-                result.add_error(f"Cannot read file at all: {file_path}: {e}")
-
+            result.add_error(f"Encoding error (tried {', '.join(self.ENCODINGS)}): {file_path}: {last_error}")
             return
 
+        # Match text-mode reads, which translate CRLF and lone CR to LF
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
         # Successfully read content
         result.content = content
 
         # Warn if very long lines (might be minified/corrupted)
-        lines = content.split("\n")
-        max_line_len = max(len(line) for line in lines) if lines else 0
-        if max_line_len > 10000:
+        if self._has_long_line(content, self.MAX_LINE_LENGTH):
+            max_line_len = self._longest_line(content)
             result.add_warning(f"Very long line detected ({max_line_len} chars): {file_path}")
 
+    @staticmethod
+    def _has_long_line(content: str, limit: int) -> bool:
+        """Check whether any line is longer than limit without splitting the content."""
+        # A line longer than limit leaves a window of limit + 1 chars with no newline. Jumping to
+        # the last newline in each window visits about len(content) / limit windows, all in C.
+        pos = 0
+        while len(content) - pos > limit:
+            newline = content.rfind("\n", pos, pos + limit + 1)
+            if newline == -1:
+                return True
+            pos = newline + 1
+        return False
+
+    @staticmethod
+    def _longest_line(content: str) -> int:
+        """Length of the longest line, found with str.find instead of materializing every line."""
+        longest = 0
+        start = 0
+        newline = content.find("\n")
+        while newline != -1:
+            longest = max(longest, newline - start)
+            start = newline + 1
+            newline = content.find("\n", start)
+        return max(longest, len(content) - start)
+
     def _validate_frontmatter(self, result: ValidationResult):
         """Validate YAML frontmatter if present."""
         if not result.content:
@@ -327,39 +446,40 @@ class FileValidator:
             # No frontmatter is fine
             return
 
-        # Extract frontmatter
-        lines = result.content.split("\n")
-        if len(lines) < 3:
-            # Too short to have valid frontmatter
+        content = result.content
+
+        # Too short to have valid frontmatter unless there are at least three lines
+        body_start = content.find("\n") + 1
+        if not body_start or content.find("\n", body_start) == -1:
             if self.strict_frontmatter:
                 result.add_error("Invalid frontmatter: too short")
             return
 
         # Find closing marker
-        end_idx = None
-        for i, line in enumerate(lines[1:], start=1):
-            if line.strip() == "---" or line.strip() == "...":
-                end_idx = i
-                break
-
-        if end_idx is None:
+        closing = self.FRONTMATTER_END_PATTERN.search(content, body_start)
+        if closing is None:
             if self.strict_frontmatter:
                 result.add_error("Invalid frontmatter: no closing marker")
             else:
                 result.add_warning("Frontmatter appears incomplete (no closing ---)")
             return
 
-        # Extract frontmatter content
-        frontmatter_lines = lines[1:end_idx]
-        frontmatter_text = "\n".join(frontmatter_lines)
+        # Extract frontmatter content (without the newline before the closing marker)
+        frontmatter_text = content[body_start : max(body_start, closing.start() - 1)]
 
-        # Try to parse as YAML
+        # Frontmatter of only spaces and newlines loads as None; no need to start a parser for it
+        if not frontmatter_text.strip(" \n"):
+            result.frontmatter = {}
+            return
+
+        # Try to parse as YAML. Well-formed YAML can still fail to construct (e.g. "!!int abc"),
+        # which SafeLoader reports as ValueError/TypeError rather than YAMLError.
         if HAS_YAML:
+            yaml, _ = _yaml()
             try:
-                parsed = yaml.safe_load(frontmatter_text)
-                result.frontmatter = parsed if isinstance(parsed, dict) else {}
+                result.frontmatter = _load_frontmatter(frontmatter_text)
 
-            except yaml.YAMLError as e:
+            except (yaml.YAMLError, ValueError, TypeError) as e:
                 if self.strict_frontmatter:
                     result.add_error(f"Invalid YAML in frontmatter: {e}")
                 else:
@@ -368,7 +488,12 @@ class FileValidator:
             result.add_warning("Cannot validate frontmatter (PyYAML not installed)")
 
     def validate_batch(
-        self, file_paths: Sequence[str | Path], on_error: str = "continue"
+        self,
+        file_paths: Sequence[str | Path],
+        on_error: str = "continue",
+        parallel: bool = True,
+        workers: int | None = None,
+        use_processes: bool = False,
     ) -> dict[str, ValidationResult]:
         """
         Validate multiple files.
@@ -376,18 +501,115 @@ class FileValidator:
         Args:
             file_paths: List of files to validate
             on_error: 'continue' to keep going, 'stop' to halt on first error
+            parallel: Validate files concurrently (results keep input order)
+            workers: Pool size (default: 4 threads per CPU, or one process per CPU)
+            use_processes: Use a process pool for CPU-heavy (decode/YAML) workloads (bypasses the result cache)
 
         Returns:
             Dict mapping file paths to validation results
         """
-        results = {}
+        return self._validate_many(file_paths, None, on_error, parallel, workers, use_processes)
 
-        for file_path in file_paths:
-            result = self.validate_file(file_path)
-            results[str(file_path)] = result
+    def validate_dir(
+        self,
+        directory: str | Path,
+        recursive: bool = True,
+        extensions: Sequence[str] = (".md", ".markdown"),
+        on_error: str = "continue",
+        parallel: bool = True,
+        workers: int | None = None,
+        use_processes: bool = False,
+    ) -> dict[str, ValidationResult]:
+        """
+        Validate every markdown file under a directory.
 
-            if on_error == "stop" and not result.is_valid:
-                break
+        Walks with os.scandir so each file's stat comes from its DirEntry (cached,
+        and free on Windows) instead of separate exists/is_file/stat calls.
+
+        Unlike Path.rglob, hidden directories (".git", ".venv", ...) are not entered.
+        Symlinked directories are not followed either, so link loops cannot repeat
+        files; symlinked files are validated.
+
+        Args:
+            directory: Directory to scan
+            recursive: Descend into subdirectories (hidden and symlinked ones are skipped)
+            extensions: File suffixes to validate (case-insensitive)
+            on_error, parallel, workers, use_processes: As for validate_batch
+
+        Returns:
+            Dict mapping file paths to validation results
+        """
+        suffixes = tuple(ext.lower() for ext in extensions)
+        file_paths: list[Path] = []
+        stat_results: list[os.stat_result | None] = []
+
+        pending = [os.fspath(directory)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and not entry.name.startswith("."):
+                                pending.append(entry.path)
+                        elif entry.is_symlink() and entry.is_dir():
+                            continue  # Symlinked directory: never followed
+                        elif entry.name.lower().endswith(suffixes):
+                            file_paths.append(Path(entry.path))
+                            try:
+                                stat_results.append(entry.stat())
+                            except OSError:
+                                # Dangling symlink etc.; validate_file re-stats and reports it
+                                stat_results.append(None)
+            except OSError as e:
+                logger.warning("Cannot scan directory: %s", e)
+
+        return self._validate_many(file_paths, stat_results, on_error, parallel, workers, use_processes)
+
+    def _validate_many(
+        self,
+        file_paths: Sequence[str | Path],
+        stat_results: Sequence[os.stat_result | None] | None,
+        on_error: str,
+        parallel: bool,
+        workers: int | None,
+        use_processes: bool,
+    ) -> dict[str, ValidationResult]:
+        """Validate files in input order, optionally on a thread or process pool."""
+        results: dict[str, ValidationResult] = {}
+        stats: Sequence[os.stat_result | None] = stat_results or [None] * len(file_paths)
+
+        if not parallel or len(file_paths) < 2:
+            for file_path, stat_result in zip(file_paths, stats, strict=True):
+                result = self.validate_file(file_path, stat_result)
+                results[str(file_path)] = result
+
+                if on_error == "stop" and not result.is_valid:
+                    break
+
+            return results
+
+        cpu_count = os.cpu_count() or 1
+        executor: Executor
+        if use_processes:
+            max_workers = workers or cpu_count
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            max_workers = workers or cpu_count * 4
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        # With 'stop', submit one pool-sized chunk at a time so work past the first
+        # failure (in input order) is limited to the chunk already in flight
+        chunk_size = max_workers if on_error == "stop" else len(file_paths)
+
+        with executor:
+            for offset in range(0, len(file_paths), chunk_size):
+                chunk = file_paths[offset : offset + chunk_size]
+                stat_chunk = stats[offset : offset + chunk_size]
+                for file_path, result in zip(chunk, executor.map(self.validate_file, chunk, stat_chunk), strict=True):
+                    results[str(file_path)] = result
+
+                    if on_error == "stop" and not result.is_valid:
+                        return results
 
         return results
 
@@ -400,7 +622,9 @@ class FileValidator:
         total_errors = sum(len(r.errors) for r in results.values())
         total_warnings = sum(len(r.warnings) for r in results.values())
 
-        summary = f"""
+        # Collected as parts and joined once; repeated += would copy the report on every line
+        parts = [
+            f"""
 # File Validation Summary
 
 **Total Files:** {total}
@@ -412,19 +636,33 @@ class FileValidator:
 
 ## Invalid Files
 """
+        ]
 
         for path, result in results.items():
             if not result.is_valid:
-                summary += f"\n### {Path(path).name}\n"
-                for error in result.errors:
-                    summary += f"- ❌ {error}\n"
-                for warning in result.warnings:
-                    summary += f"- ⚠️  {warning}\n"
+                parts.append(f"\n### {os.path.basename(path)}\n")
+                parts.extend(f"- ❌ {error}\n" for error in result.errors)
+                parts.extend(f"- ⚠️  {warning}\n" for warning in result.warnings)
 
         if invalid == 0:
-            summary += "\n✅ No invalid files!\n"
+            parts.append("\n✅ No invalid files!\n")
+
+        return "".join(parts)
+
+
+@cache
+def _yaml() -> tuple[Any, Any]:
+    """Import PyYAML and pick its libyaml-backed safe loader if built with it (else pure Python)."""
+    import yaml
+
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
-        return summary
+def _load_frontmatter(frontmatter_text: str) -> dict[str, Any]:
+    """Load frontmatter YAML, treating a non-mapping document as empty."""
+    yaml, safe_loader = _yaml()
+    parsed = yaml.load(frontmatter_text, Loader=safe_loader)
+    return parsed if isinstance(parsed, dict) else {}
 
 
 # Convenience function for quick validation
@@ -454,9 +692,9 @@ if __name__ == "__main__":
             print(f"  ⚠️  {warning}")
 
     elif path.is_dir():
-        files = list(path.rglob("*.md"))
-        print(f"\nValidating {len(files)} markdown files...")
-        results = validator.validate_batch(files)
+        # Hidden and symlinked directories are skipped (see validate_dir)
+        results = validator.validate_dir(path)
+        print(f"\nValidated {len(results)} markdown files...")
         print(validator.get_summary(results))
 
     else:
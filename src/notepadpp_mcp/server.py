@@ -46,7 +46,7 @@ except ImportError:
     WINDOWS_AVAILABLE = False
 
 # Import the Notepad++ controller
-from .tools.controller import NotepadPPController
+from .tools.controller import NotepadPPController, call_win32, parse_window_title
 from .web import setup_webapp
 
 logger = logging.getLogger(__name__)
@@ -263,11 +263,8 @@ async def notepad_dashboard() -> Column:
     tab_details = []
     if controller and getattr(controller, "hwnd", None):
         try:
-            window_text = controller.get_window_text(controller.hwnd or 0)
-            filename = "Untitled"
-            if " - Notepad++" in window_text:
-                filename = window_text.split(" - Notepad++")[0]
-            is_modified = "*" in window_text
+            window_text = await call_win32(controller.get_window_text, controller.hwnd or 0)
+            filename, is_modified = parse_window_title(window_text)
             tab_details = [
                 f"Active File: {filename}",
                 f"Unsaved Changes: {'Yes' if is_modified else 'No'}",
@@ -2,7 +2,7 @@
 Robust file sync health monitoring for MCP servers.
 
 This module provides:
-- Structured logging for sync operations
+- Structured logging for sync operations (stdlib logging, fields in `extra`)
 - Health checks and diagnostics
 - Stall detection
 - Automatic recovery
@@ -20,22 +20,95 @@ Usage:
 
 import asyncio
 import logging
+import os
+import stat
 import time
 import traceback
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-try:
-    import structlog
+logger = logging.getLogger(__name__)
 
-    logger = structlog.get_logger(__name__)
-    HAS_STRUCTLOG = True
-except ImportError:
-    logger = logging.getLogger(__name__)
-    HAS_STRUCTLOG = False
+
+def _iter_md_scandir(path: str, top: bool = True) -> Iterator[os.DirEntry]:
+    """Yield the .md file entries under `path`, recursively, without following symlinks.
+
+    DirEntry type checks come from the directory listing itself, so this costs about
+    one syscall per entry instead of rglob's stat() plus a Path object for each.
+    Unreadable subdirectories are skipped; errors on `path` itself propagate.
+    """
+    try:
+        it = os.scandir(path)
+    except PermissionError:
+        if top:
+            raise
+        return
+    with it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_md_scandir(entry.path, top=False)
+            elif entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Minimum seconds between scan_progress log records
+PROGRESS_LOG_INTERVAL = 1.0
+
+# Seconds a health report is reused while nothing has changed (runtime figures may lag by this much)
+REPORT_CACHE_TTL = 1.0
+
+# Errors kept for the health report; older ones are dropped (errors_count keeps the total)
+MAX_RECORDED_ERRORS = 100
+
+# Below this many top-level subdirectories a thread pool costs more than it saves
+_PARALLEL_MIN_SUBDIRS = 8
+
+
+def _count_md_subtree(path: str) -> int:
+    """Count the .md files below a subdirectory (unreadable parts are skipped)."""
+    return sum(1 for _ in _iter_md_scandir(path, top=False))
+
+
+def _count_md_files(root: str) -> int:
+    """
+    Count the .md files under `root`.
+
+    The walk is bound by filesystem latency, so each top-level subdirectory is
+    walked on its own thread once there are enough of them to be worth it.
+    """
+    count = 0
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                count += 1
+
+    if len(subdirs) < _PARALLEL_MIN_SUBDIRS:
+        return count + sum(map(_count_md_subtree, subdirs))
+
+    workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="md-count") as pool:
+        return count + sum(pool.map(_count_md_subtree, subdirs))
 
 
 class SyncState(Enum):
@@ -53,6 +126,18 @@ class SyncState(Enum):
     STALLED = "stalled"
 
 
+# States that make the health report unhealthy
+UNHEALTHY_STATES = frozenset(
+    {
+        SyncState.ERROR_PERMISSION,
+        SyncState.ERROR_NOT_FOUND,
+        SyncState.ERROR_TIMEOUT,
+        SyncState.ERROR_UNKNOWN,
+        SyncState.STALLED,
+    }
+)
+
+
 @dataclass
 class SyncMetrics:
     """Sync performance metrics."""
@@ -61,14 +146,15 @@ class SyncMetrics:
     files_scanned: int = 0
     files_per_second: float = 0.0
     bytes_processed: int = 0
-    start_time: float = field(default_factory=time.time)
-    last_progress_time: float = field(default_factory=time.time)
+    # time.monotonic() readings: NTP/clock changes cannot fake a stall or a negative runtime
+    start_time: float = field(default_factory=time.monotonic)
+    last_progress_time: float = field(default_factory=time.monotonic)
     errors_count: int = 0
 
     @property
     def runtime_seconds(self) -> float:
         """Get total runtime in seconds."""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
 
     @property
     def progress_percent(self) -> float:
@@ -80,15 +166,16 @@ class SyncMetrics:
     @property
     def time_since_progress(self) -> float:
         """Time since last progress update."""
-        return time.time() - self.last_progress_time
+        return time.monotonic() - self.last_progress_time
 
     def update_progress(self, files_scanned: int):
         """Update progress metrics."""
         self.files_scanned = files_scanned
-        self.last_progress_time = time.time()
+        self.last_progress_time = now = time.monotonic()
 
-        if self.runtime_seconds > 0:
-            self.files_per_second = self.files_scanned / self.runtime_seconds
+        runtime = now - self.start_time
+        if runtime > 0:
+            self.files_per_second = self.files_scanned / runtime
 
 
 class SyncHealthMonitor:
@@ -124,11 +211,19 @@ class SyncHealthMonitor:
         self.check_interval = check_interval
         self.max_recovery_attempts = max_recovery_attempts
 
+        # Bumped by every state change, progress update and error; keys the report cache
+        self._state_version = 0
+        self._report_cache: dict[str, Any] | None = None
+        self._report_cache_version = -1
+        self._report_cache_time = 0.0
+
         self.state = SyncState.INITIALIZING
         self.metrics = SyncMetrics()
-        self.errors: list[dict[str, Any]] = []
+        self.errors: deque[dict[str, Any]] = deque(maxlen=MAX_RECORDED_ERRORS)
         self.recovery_attempts = 0
         self.watcher = None
+        # time.monotonic() of the last scan_progress record
+        self._last_progress_log = 0.0
 
         self._monitor_task: asyncio.Task | None = None
         self._is_monitoring = False
@@ -139,21 +234,31 @@ class SyncHealthMonitor:
             stall_timeout=stall_timeout,
         )
 
+    @property
+    def state(self) -> SyncState:
+        """Current sync state."""
+        return self._state
+
+    @state.setter
+    def state(self, value: SyncState):
+        self._state = value
+        self._state_version += 1
+
     def _log(self, event: str, level: str = "info", **kwargs):
-        """Log with structured or standard logging."""
-        if HAS_STRUCTLOG:
-            getattr(logger, level)(event, **kwargs)
-        else:
-            msg = f"{event}: {kwargs}"
-            getattr(logger, level)(msg)
+        """Log a sync event; the fields ride on the record as `event` / `sync_fields`."""
+        # %-style args: the message is only formatted if a handler emits the record
+        logger.log(_LOG_LEVELS[level], "%s: %s", event, kwargs, extra={"event": event, "sync_fields": kwargs})
 
     def count_files(self) -> int:
         """Count markdown files in project."""
         try:
             self.state = SyncState.COUNTING
+            if not stat.S_ISDIR(os.stat(self.project_path).st_mode):
+                raise FileNotFoundError(f"Project path is not a directory: {self.project_path}")
+
             self._log("counting_files", path=str(self.project_path))
 
-            count = len(list(self.project_path.rglob("*.md")))
+            count = _count_md_files(str(self.project_path))
 
             self._log("file_count_complete", count=count, path=str(self.project_path))
 
@@ -171,13 +276,22 @@ class SyncHealthMonitor:
 
         except Exception as e:
             self.state = SyncState.ERROR_UNKNOWN
-            self._add_error("count_failed", str(e), traceback.format_exc())
+            # Cap the rendered frames; the error deque keeps up to MAX_RECORDED_ERRORS of these
+            self._add_error("count_failed", str(e), traceback.format_exc(limit=10))
             raise
 
-    def start_scan(self) -> bool:
+    async def count_files_async(self) -> int:
+        """Run count_files() on a worker thread so a long walk does not stall the event loop."""
+        return await asyncio.to_thread(self.count_files)
+
+    def start_scan(self, files_total: int | None = None) -> bool:
         """
         Start file scanning.
 
+        Args:
+            files_total: Fresh count of markdown files, if the caller already has one
+                (skips the walk); counted here when omitted
+
         Returns:
             True if started successfully, False otherwise
         """
@@ -185,7 +299,7 @@ class SyncHealthMonitor:
             self._log("scan_starting")
 
             # Count files first
-            self.metrics.files_total = self.count_files()
+            self.metrics.files_total = self.count_files() if files_total is None else files_total
 
             if self.metrics.files_total == 0:
                 self._log("no_files_found", level="warning")
@@ -213,6 +327,7 @@ class SyncHealthMonitor:
     def update_scan_progress(self, files_scanned: int):
         """Update scan progress."""
         self.metrics.update_progress(files_scanned)
+        self._state_version += 1
 
         if files_scanned == self.metrics.files_total:
             self.state = SyncState.COMPLETED
@@ -221,8 +336,10 @@ class SyncHealthMonitor:
                 files=files_scanned,
                 duration=self.metrics.runtime_seconds,
             )
-        elif files_scanned % 100 == 0:
-            # Log every 100 files
+        elif (now := time.monotonic()) - self._last_progress_log >= PROGRESS_LOG_INTERVAL:
+            # One record per interval however fast files arrive; completion and
+            # stalls log their own counts, so nothing is lost between records
+            self._last_progress_log = now
             self._log(
                 "scan_progress",
                 scanned=files_scanned,
@@ -240,6 +357,7 @@ class SyncHealthMonitor:
         }
         self.errors.append(error)
         self.metrics.errors_count += 1
+        self._state_version += 1
 
         self._log("error_logged", level="error", error_type=error_type, message=message)
 
@@ -317,10 +435,10 @@ class SyncHealthMonitor:
             # Reset state
             self.state = SyncState.INITIALIZING
             self.metrics = SyncMetrics()
-            self.metrics.files_total = self.count_files()
+            files_total = await self.count_files_async()
 
-            # Restart scan
-            self.start_scan()
+            # Restart scan with that count, so the tree is walked once per recovery
+            self.start_scan(files_total)
 
             self._log("recovery_successful", attempt=self.recovery_attempts)
 
@@ -336,18 +454,22 @@ class SyncHealthMonitor:
         """
         Get comprehensive health report.
 
+        Polled reports are served from a cache until the state changes or
+        REPORT_CACHE_TTL passes; treat the returned dict as read-only.
+
         Returns:
             Dictionary with health status, metrics, and diagnostics
         """
-        return {
-            "healthy": self.state
-            not in [
-                SyncState.ERROR_PERMISSION,
-                SyncState.ERROR_NOT_FOUND,
-                SyncState.ERROR_TIMEOUT,
-                SyncState.ERROR_UNKNOWN,
-                SyncState.STALLED,
-            ],
+        now = time.monotonic()
+        if (
+            self._report_cache is not None
+            and self._report_cache_version == self._state_version
+            and now - self._report_cache_time < REPORT_CACHE_TTL
+        ):
+            return self._report_cache
+
+        report = {
+            "healthy": self.state not in UNHEALTHY_STATES,
             "state": self.state.value,
             "metrics": {
                 "files_total": self.metrics.files_total,
@@ -362,10 +484,14 @@ class SyncHealthMonitor:
                 "exists": self.watcher is not None,
                 "alive": self.watcher.is_alive() if self.watcher and hasattr(self.watcher, "is_alive") else None,
             },
-            "errors": self.errors[-10:],  # Last 10 errors
+            "errors": list(self.errors)[-10:],  # Last 10 errors
             "recovery_attempts": self.recovery_attempts,
             "recommendations": self._generate_recommendations(),
         }
+        self._report_cache = report
+        self._report_cache_version = self._state_version
+        self._report_cache_time = now
+        return report
 
     def _generate_recommendations(self) -> list[str]:
         """Generate actionable recommendations."""
@@ -26,6 +26,8 @@ def patch_win32_in_modules():
     mock_gui.IsWindowVisible = MagicMock(return_value=True)
     mock_gui.GetWindowText = MagicMock(return_value="test.txt - Notepad++")
     mock_gui.GetClassName = MagicMock(return_value="Notepad++")
+    mock_gui.FindWindow = MagicMock(return_value=0)
+    mock_gui.FindWindowEx = MagicMock(return_value=0)
 
     modules_to_patch = [
         "notepadpp_mcp.tools.file_operations",
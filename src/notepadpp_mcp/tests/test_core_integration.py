@@ -3,19 +3,32 @@
 This module tests the core functionality of the Notepad++ controller.
 """
 
-from unittest.mock import patch
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from notepadpp_mcp.tools.controller import (
-    DEFAULT_NOTEPADPP_PATHS,
+    INPUT_KEYBOARD,
+    KEYEVENTF_KEYUP,
+    KEYEVENTF_UNICODE,
     NOTEPADPP_AUTO_START,
     NOTEPADPP_TIMEOUT,
+    NPP_MENU_COMMANDS,
     WINDOWS_AVAILABLE,
+    WM_COMMAND,
+    WM_COPYDATA,
     NotepadPPController,
     NotepadPPError,
     NotepadPPNotFoundError,
+    _chord_inputs,
+    _default_notepadpp_paths,
+    _unicode_inputs,
     handle_tool_errors,
+    parse_window_title,
+    spawn_notepadpp,
+    win_error,
 )
 
 
@@ -36,19 +49,52 @@ class TestNotepadPPControllerCore:
         """Test successful Notepad++ detection."""
         controller = NotepadPPController()
 
-        with patch.object(controller, "_find_notepadpp_window", return_value=12345):
-            with patch.object(controller, "_find_scintilla_window", return_value=54321):
+        with patch.object(NotepadPPController, "_find_notepadpp_window", return_value=12345):
+            with patch.object(NotepadPPController, "_find_scintilla_window", return_value=54321):
                 result = await controller.ensure_notepadpp_running()
                 assert result is True
                 assert controller.hwnd == 12345
                 assert controller.scintilla_hwnd == 54321
 
+    @pytest.mark.asyncio
+    async def test_ensure_notepadpp_running_reuses_valid_handles(self, mock_win32):
+        """Test that live cached handles skip the window scan."""
+        controller = NotepadPPController()
+        controller.hwnd = 12345
+        controller.scintilla_hwnd = 54321
+
+        with patch("notepadpp_mcp.tools.controller.win32gui.IsWindow", return_value=True):
+            with patch.object(NotepadPPController, "_find_notepadpp_window") as mock_find:
+                result = await controller.ensure_notepadpp_running()
+                assert result is True
+                mock_find.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ensure_notepadpp_running_auto_start_backs_off(self, mock_win32):
+        """Test that auto-start polls with backoff when input-idle is unavailable."""
+        controller = NotepadPPController()
+
+        with (
+            patch("notepadpp_mcp.tools.controller.NOTEPADPP_AUTO_START", True),
+            patch("notepadpp_mcp.tools.controller.subprocess.Popen") as mock_popen,
+            patch("notepadpp_mcp.tools.controller._wait_for_input_idle", return_value=False),
+            patch.object(
+                NotepadPPController, "_find_notepadpp_window", side_effect=[None, None, None, 12345]
+            ) as mock_find,
+            patch.object(NotepadPPController, "_find_scintilla_window", return_value=54321),
+        ):
+            result = await controller.ensure_notepadpp_running()
+            assert result is True
+            assert controller.hwnd == 12345
+            mock_popen.assert_called_once()
+            assert mock_find.call_count == 4
+
     @pytest.mark.asyncio
     async def test_ensure_notepadpp_running_not_found(self, mock_win32):
         """Test Notepad++ not found scenario."""
         controller = NotepadPPController()
 
-        with patch.object(controller, "_find_notepadpp_window", return_value=None):
+        with patch.object(NotepadPPController, "_find_notepadpp_window", return_value=None):
             with patch("notepadpp_mcp.tools.controller.NOTEPADPP_AUTO_START", False):
                 with pytest.raises(NotepadPPNotFoundError):
                     await controller.ensure_notepadpp_running()
@@ -75,6 +121,70 @@ class TestNotepadPPControllerCore:
             with pytest.raises(NotepadPPError):
                 await controller.send_message(12345, 0x000E, 0, 0)
 
+    @pytest.mark.asyncio
+    async def test_post_message(self, mock_win32):
+        """Test posting Windows messages (fire-and-forget)."""
+        controller = NotepadPPController()
+
+        with patch("notepadpp_mcp.tools.controller._post_message_w", return_value=True) as mock_post:
+            assert await controller.post_message(12345, 0x0100, 0x4E, 0) is True
+            mock_post.assert_called_once_with(12345, 0x0100, 0x4E, 0)
+
+        with patch("notepadpp_mcp.tools.controller._post_message_w", return_value=False):
+            with pytest.raises(NotepadPPError):
+                await controller.post_message(12345, 0x0100, 0x4E, 0)
+
+    @pytest.mark.asyncio
+    async def test_run_menu_command_sends_or_posts(self, mock_win32):
+        """Test dialog-opening menu commands are posted and the rest sent as WM_COMMAND."""
+        controller = NotepadPPController()
+        controller.hwnd = 12345
+
+        with (
+            patch("notepadpp_mcp.tools.controller._send_message_w", return_value=0) as mock_send,
+            patch("notepadpp_mcp.tools.controller._post_message_w", return_value=True) as mock_post,
+        ):
+            assert controller.run_menu_command("select_all") is True
+            mock_send.assert_called_once_with(12345, WM_COMMAND, NPP_MENU_COMMANDS["select_all"], 0)
+            assert controller.run_menu_command("save") is True
+            mock_post.assert_called_once_with(12345, WM_COMMAND, NPP_MENU_COMMANDS["save"], 0)
+
+    @pytest.mark.asyncio
+    async def test_select_all_falls_back_to_keystrokes(self, mock_win32):
+        """Test a WM_COMMAND Select All that leaves the buffer unselected switches to accelerators."""
+        controller = NotepadPPController()
+        controller.hwnd = 12345
+
+        with (
+            patch("notepadpp_mcp.tools.controller._send_message_w", return_value=0),
+            patch.object(NotepadPPController, "get_buffer_length", return_value=10),
+            patch.object(NotepadPPController, "get_selection", return_value=(3, 3)),
+            patch.object(NotepadPPController, "_menu_keys", return_value=True) as mock_keys,
+        ):
+            assert controller.select_all() is True
+            mock_keys.assert_called_once_with("select_all")
+            assert controller.copy_selection_to_clipboard() is True
+            mock_keys.assert_called_with("copy")
+
+    @pytest.mark.asyncio
+    async def test_open_file_uses_copydata_then_falls_back(self, mock_win32):
+        """Test files are handed over as WM_COPYDATA, launching notepad++.exe only if it is refused."""
+        controller = NotepadPPController()
+        controller.hwnd = 12345
+        controller.notepadpp_exe = "notepad++.exe"
+
+        with (
+            patch("notepadpp_mcp.tools.controller._send_message_w", return_value=1) as mock_send,
+            patch("notepadpp_mcp.tools.controller.spawn_notepadpp") as mock_spawn,
+        ):
+            assert controller.open_file("C:\\a b.txt") is True
+            assert mock_send.call_args.args[1] == WM_COPYDATA
+            mock_spawn.assert_not_called()
+
+            mock_send.return_value = 0
+            assert controller.open_file("C:\\a b.txt") is True
+            mock_spawn.assert_called_once_with(["notepad++.exe", "C:\\a b.txt"])
+
     @pytest.mark.asyncio
     async def test_get_window_text_success(self, mock_win32):
         """Test getting window text."""
@@ -116,6 +226,67 @@ class TestNotepadPPControllerCore:
                         result = controller._find_notepadpp_window()
                         assert result == 12345
 
+    @pytest.mark.asyncio
+    async def test_find_notepadpp_window_stops_at_first_match(self, mock_win32):
+        """Test enumeration stops once the first Notepad++ window is found."""
+        controller = NotepadPPController()
+        visited: list[int] = []
+
+        def mock_enum(callback, extra):
+            for hwnd in (111, 12345, 67890):
+                visited.append(hwnd)
+                callback(hwnd, extra)
+
+        def mock_class(hwnd):
+            return "Notepad++" if hwnd in (12345, 67890) else "Other"
+
+        with patch("notepadpp_mcp.tools.controller.win32gui.EnumWindows", side_effect=mock_enum):
+            with patch("notepadpp_mcp.tools.controller.win32gui.IsWindowVisible", return_value=True):
+                with patch("notepadpp_mcp.tools.controller.win32gui.GetClassName", side_effect=mock_class):
+                    with patch("notepadpp_mcp.tools.controller.win32gui.GetWindowText", return_value=""):
+                        assert controller._find_notepadpp_window() == 12345
+                        assert visited == [111, 12345]
+
+    @pytest.mark.asyncio
+    async def test_find_notepadpp_window_uses_find_window(self, mock_win32):
+        """Test a visible class match from FindWindow skips the EnumWindows walk."""
+        controller = NotepadPPController()
+
+        with (
+            patch("notepadpp_mcp.tools.controller.win32gui.FindWindow", return_value=12345) as mock_find,
+            patch("notepadpp_mcp.tools.controller.win32gui.IsWindowVisible", return_value=True),
+            patch("notepadpp_mcp.tools.controller.win32gui.EnumWindows") as mock_enum,
+        ):
+            assert controller._find_notepadpp_window() == 12345
+            mock_find.assert_called_once_with("Notepad++", None)
+            mock_enum.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_modal_dialog_scans_npp_thread_only(self, mock_win32):
+        """Test the dialog lookup walks only the Notepad++ UI thread and stops at the first dialog."""
+        controller = NotepadPPController()
+        controller.hwnd = 12345
+        win32process = MagicMock()
+        win32process.GetWindowThreadProcessId.return_value = (777, 4242)
+        visited: list[int] = []
+
+        def mock_enum_thread(tid, callback, extra):
+            assert tid == 777
+            for hwnd in (1, 2, 3):
+                visited.append(hwnd)
+                callback(hwnd, extra)
+
+        with (
+            patch.dict(sys.modules, {"win32process": win32process}),
+            patch("notepadpp_mcp.tools.controller.win32gui.EnumThreadWindows", side_effect=mock_enum_thread),
+            patch(
+                "notepadpp_mcp.tools.controller.win32gui.GetClassName",
+                side_effect=lambda hwnd: "#32770" if hwnd == 2 else "Notepad++",
+            ),
+        ):
+            assert controller._find_modal_dialog() == 2
+            assert visited == [1, 2]
+
     @pytest.mark.asyncio
     async def test_find_notepadpp_window_not_found(self, mock_win32):
         """Test finding Notepad++ window when not found."""
@@ -138,6 +309,26 @@ class TestNotepadPPControllerCore:
                 result = controller._find_scintilla_window(12345)
                 assert result == 54321
 
+    @pytest.mark.asyncio
+    async def test_find_scintilla_window_direct_children(self, mock_win32):
+        """Test the edit views are found with FindWindowEx, picking the one with content."""
+        controller = NotepadPPController()
+        children = {0: 111, 111: 222, 222: 0}
+
+        with (
+            patch(
+                "notepadpp_mcp.tools.controller.win32gui.FindWindowEx",
+                side_effect=lambda parent, after, cls, name: children[after],
+            ),
+            patch("notepadpp_mcp.tools.controller.win32gui.EnumChildWindows") as mock_enum_child,
+            patch(
+                "notepadpp_mcp.tools.controller._send_message_w",
+                side_effect=lambda hwnd, msg, wparam, lparam: 0 if hwnd == 111 else 42,
+            ),
+        ):
+            assert controller._find_scintilla_window(12345) == 222
+            mock_enum_child.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_find_scintilla_window_not_found(self, mock_win32):
         """Test finding Scintilla window when not found."""
@@ -202,6 +393,21 @@ class TestErrorHandling:
         assert "error" in result
         assert "Notepad++ not found" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_handle_tool_errors_reports_win32_error(self):
+        """Test a wrapped Win32 failure surfaces its code, function and message as fields."""
+        win32_failure = OSError(0, "Invalid window handle.")
+        win32_failure.winerror = 1400
+        win32_failure.funcname = "SendMessage"
+
+        @handle_tool_errors
+        async def test_func():
+            raise NotepadPPError("Failed to send message") from win32_failure
+
+        result = await test_func()
+        assert result["win_error"] == {"code": 1400, "func": "SendMessage", "message": "Invalid window handle."}
+        assert win_error(ValueError("plain")) == {}
+
 
 class TestWindowsAPIIntegration:
     """Test Windows API integration scenarios."""
@@ -222,16 +428,29 @@ class TestWindowsAPIIntegration:
         """Test Notepad++ path detection."""
         controller = NotepadPPController()
 
-        with patch("os.path.exists", return_value=True):
+        with patch("os.path.isfile", return_value=True):
             result = controller._find_notepadpp_exe()
             assert result is not None
 
+    @pytest.mark.asyncio
+    async def test_notepadpp_exe_resolved_lazily(self):
+        """Test the executable is located on first access, not at construction."""
+        with (
+            patch("notepadpp_mcp.tools.controller._notepadpp_exe", None),
+            patch.object(NotepadPPController, "_find_notepadpp_exe", return_value="C:/npp.exe") as mock_find,
+        ):
+            controller = NotepadPPController()
+            mock_find.assert_not_called()
+            assert controller.notepadpp_exe == "C:/npp.exe"
+            assert controller.notepadpp_exe == "C:/npp.exe"
+            mock_find.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_notepadpp_path_not_found(self):
         """Test Notepad++ path not found."""
         controller = NotepadPPController()
 
-        with patch("pathlib.Path.exists", return_value=False):
+        with patch("os.path.isfile", return_value=False):
             with pytest.raises(NotepadPPNotFoundError):
                 controller._find_notepadpp_exe()
 
@@ -241,9 +460,19 @@ class TestConfiguration:
 
     def test_default_notepadpp_paths(self):
         """Test default Notepad++ paths."""
-        assert isinstance(DEFAULT_NOTEPADPP_PATHS, list)
-        assert len(DEFAULT_NOTEPADPP_PATHS) > 0
-        assert all(isinstance(path, str) for path in DEFAULT_NOTEPADPP_PATHS)
+        paths = _default_notepadpp_paths()
+        assert isinstance(paths, list)
+        assert len(paths) > 0
+        assert all(isinstance(path, str) for path in paths)
+
+    def test_spawn_notepadpp_has_no_pipes(self):
+        """Test launches discard stdio instead of opening pipes nobody reads."""
+        with patch("notepadpp_mcp.tools.controller.subprocess.Popen") as mock_popen:
+            spawn_notepadpp(["notepad++.exe", "a.txt"])
+        args, kwargs = mock_popen.call_args
+        assert args == (["notepad++.exe", "a.txt"],)
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.DEVNULL
 
     def test_configuration_constants(self):
         """Test configuration constants."""
@@ -252,6 +481,43 @@ class TestConfiguration:
         assert NOTEPADPP_TIMEOUT > 0
 
 
+class TestSendInput:
+    """Test SendInput event construction."""
+
+    def test_unicode_inputs_pairs_utf16_code_units(self):
+        """Test one key-down/key-up pair per UTF-16 code unit (surrogates included)."""
+        inputs = _unicode_inputs("hé\U0001f600")
+        assert len(inputs) == 8
+        assert all(event.type == INPUT_KEYBOARD for event in inputs)
+        assert [event.u.ki.wScan for event in inputs[::2]] == [0x68, 0xE9, 0xD83D, 0xDE00]
+        assert all(event.u.ki.dwFlags == KEYEVENTF_UNICODE for event in inputs[::2])
+        assert all(event.u.ki.dwFlags == KEYEVENTF_UNICODE | KEYEVENTF_KEYUP for event in inputs[1::2])
+
+    def test_chord_inputs_press_in_order_release_in_reverse(self):
+        """Test chords become key-down events in order and key-up events in reverse, in one array."""
+        inputs = _chord_inputs([(0x11, 0x09), (0x0D,)])  # Ctrl+Tab, Enter
+        assert all(event.type == INPUT_KEYBOARD for event in inputs)
+        assert [(event.u.ki.wVk, event.u.ki.dwFlags) for event in inputs] == [
+            (0x11, 0),
+            (0x09, 0),
+            (0x09, KEYEVENTF_KEYUP),
+            (0x11, KEYEVENTF_KEYUP),
+            (0x0D, 0),
+            (0x0D, KEYEVENTF_KEYUP),
+        ]
+
+
+class TestWindowTitle:
+    """Test Notepad++ title parsing."""
+
+    def test_parse_window_title(self):
+        """Test filename/modified parsing, including names that contain the separator."""
+        assert parse_window_title("C:\\notes\\a.txt - Notepad++") == ("C:\\notes\\a.txt", False)
+        assert parse_window_title("*Track - Notepad++ tips.md - Notepad++") == ("Track - Notepad++ tips.md", True)
+        assert parse_window_title("*new 1 - Notepad++") == ("new 1", True)
+        assert parse_window_title("Notepad++") == ("Untitled", False)
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -5,13 +5,14 @@ Consolidates Notepad++ automation helpers (macro list/play) into one tool.
 """
 
 import os
-import subprocess
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from pydantic import Field
 
+from .controller import spawn_notepadpp
+
 
 def _macro_dirs(exe_path: str | None) -> list[Path]:
     """Locate Notepad++ macro directories (roaming + portable beside the exe)."""
@@ -124,12 +125,7 @@ class AutomationOperationsTool:
                         "summary": "Notepad++ executable not found",
                         "recovery_options": ["Set NOTEPADPP_PATH"],
                     }
-                subprocess.Popen(
-                    [exe, f"-macro:{target['path']}"],
-                    shell=False,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
+                spawn_notepadpp([exe, f"-macro:{target['path']}"])
                 return {
                     "success": True,
                     "operation": operation,
@@ -9,21 +9,37 @@ TRANSPORT NOTE (empirical, Notepad++ 8.x):
   LINEFROMPOSITION, GOTOPOS, GOTOLINE.
 - Scintilla *pointer* messages (SCI_GETTEXT/SETTEXT/REPLACESEL/SETSEL/GETLINE)
   and NPPM_* menu-command messages are NOT serviced by this NPP build.
-- Therefore text transport uses the clipboard + keystrokes (needs the editor
-  foreground) with verify-after, and named files are read from disk.
+- Keyboard accelerators (Ctrl+A/C/V/N/W/S) injected into the foreground editor
+  work.
+- Therefore text transport uses the clipboard + Edit commands (Select All,
+  Copy, Paste) with verify-after, and named files are read from disk.
+
+Not yet verified on 8.x:
+- Plain WM_COMMAND with a menu ID (menuCmdID.h) is int-only and is what a menu
+  click delivers, so it should act on the active view without the foreground.
+  Menu commands are sent this way first. select_all() checks the result with
+  the int-only selection messages; if it had no effect, the controller falls
+  back to the accelerator keystrokes for the rest of its life.
+- WM_COPYDATA is the one pointer message the system marshals across processes;
+  it is how a second notepad++.exe hands its file list to the running instance,
+  and open_file() uses it the same way (launching notepad++.exe if refused).
 """
 
+import array
 import asyncio
 import ctypes
 import os
 import subprocess
 import time
-from pathlib import Path
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Any
 
 # Windows-specific imports
 try:
     import win32api
+    import win32clipboard
     import win32con
     import win32gui
 
@@ -31,6 +47,7 @@ try:
 except ImportError:
     WINDOWS_AVAILABLE = False
     win32api: Any = None
+    win32clipboard: Any = None
     win32con: Any = None
     win32gui: Any = None
 
@@ -52,28 +69,260 @@ SCI_SETTEXT = 2181
 SCI_SETSEL = 2013
 SCI_REPLACESEL = 2170
 
-# Notepad++ main-window message (attempted first for full paths; often unsupported)
+# Notepad++ main-window message - pointer lParam, so NOT usable cross-process (kept for docs)
 NPPM_GETFULLCURRENTPATH = 1024 + 213
 
-# 64-bit-safe SendMessageW signature (default ctypes marshalling truncates pointers)
-_User32SendMessageW = None
+# Notepad++ menu command IDs (menuCmdID.h), sent to the main window as WM_COMMAND
+WM_COMMAND = 0x0111
+IDM_FILE_NEW = 41001
+IDM_FILE_CLOSE = 41003
+IDM_FILE_SAVE = 41006
+IDM_EDIT_COPY = 42002
+IDM_EDIT_PASTE = 42005
+IDM_EDIT_SELECTALL = 42007
+IDM_VIEW_ZOOMRESTORE = 44033
+IDM_LANGSTYLE_CONFIG_DLG = 46001
+
+# Named menu commands for run_menu_command(); read-only so the table stays the single source
+NPP_MENU_COMMANDS: Mapping[str, int] = MappingProxyType(
+    {
+        "new": IDM_FILE_NEW,
+        "close": IDM_FILE_CLOSE,
+        "save": IDM_FILE_SAVE,
+        "copy": IDM_EDIT_COPY,
+        "paste": IDM_EDIT_PASTE,
+        "select_all": IDM_EDIT_SELECTALL,
+        "reset_zoom": IDM_VIEW_ZOOMRESTORE,
+        "style_configurator": IDM_LANGSTYLE_CONFIG_DLG,
+    }
+)
+# Commands that can open a modal dialog (save prompt, Save As, Style Configurator) are posted
+_POSTED_MENU_COMMANDS = frozenset({"close", "save", "style_configurator"})
+
+# Keyboard accelerators for the menu commands, used when WM_COMMAND is not serviced:
+# name -> (chord, settle seconds after injecting it)
+VK_CONTROL = 0x11
+_MENU_COMMAND_KEYS: Mapping[str, tuple[tuple[int, ...], float]] = MappingProxyType(
+    {
+        "new": ((VK_CONTROL, ord("N")), 0.3),
+        "close": ((VK_CONTROL, ord("W")), 0.3),
+        "save": ((VK_CONTROL, ord("S")), 0.3),
+        "copy": ((VK_CONTROL, ord("C")), 0.2),
+        "paste": ((VK_CONTROL, ord("V")), 0.3),
+        "select_all": ((VK_CONTROL, ord("A")), 0.15),
+    }
+)
+
+# Dialog button click (dismiss_save_dialog)
+BM_CLICK = 0x00F5
+
+# WM_COPYDATA hand-off of a command line of file names (Notepad++ COPYDATA_FILENAMESW)
+WM_COPYDATA = 0x004A
+COPYDATA_FILENAMESW = 2
+
+# SendInput structures (x64 layout; MOUSEINPUT is the largest union member)
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+
+class _COPYDATASTRUCT(ctypes.Structure):
+    _fields_ = [
+        ("dwData", ctypes.c_size_t),
+        ("cbData", ctypes.c_ulong),
+        ("lpData", ctypes.c_void_p),
+    ]
+
+
+# Private user32 handle with 64-bit-safe prototypes (default ctypes marshalling
+# truncates pointers). A private WinDLL instead of the shared ctypes.windll keeps
+# these argtypes from leaking into other ctypes users such as pywinauto.
+_user32: Any = None
+
+
+def _load_user32() -> Any:
+    """Load user32 and bind every prototype this module uses, once per process."""
+    global _user32
+    if _user32 is None:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        message_args = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_size_t, ctypes.c_ssize_t]
+        user32.SendMessageW.argtypes = message_args
+        user32.SendMessageW.restype = ctypes.c_ssize_t
+        user32.PostMessageW.argtypes = message_args
+        user32.PostMessageW.restype = ctypes.c_int
+        user32.SendInput.argtypes = [ctypes.c_uint, ctypes.POINTER(_INPUT), ctypes.c_int]
+        user32.SendInput.restype = ctypes.c_uint
+        user32.WaitForInputIdle.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+        user32.WaitForInputIdle.restype = ctypes.c_uint
+        _user32 = user32
+    return _user32
 
 
 def _send_message_w(hwnd: int, msg: int, wparam: int, lparam) -> int:
     """SendMessageW with explicit 64-bit argtypes (pointer-safe)."""
-    global _User32SendMessageW
-    if _User32SendMessageW is None:
-        _User32SendMessageW = ctypes.windll.user32.SendMessageW
-        _User32SendMessageW.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_uint,
-            ctypes.c_size_t,
-            ctypes.c_ssize_t,
-        ]
-        _User32SendMessageW.restype = ctypes.c_ssize_t
     if lparam is None:
         lparam = 0
-    return int(_User32SendMessageW(hwnd, msg, wparam, lparam))
+    return int(_load_user32().SendMessageW(hwnd, msg, wparam, lparam))
+
+
+def _post_message_w(hwnd: int, msg: int, wparam: int, lparam: int) -> bool:
+    """PostMessageW with explicit 64-bit argtypes; queues the message and returns immediately."""
+    return bool(_load_user32().PostMessageW(hwnd, msg, wparam, lparam))
+
+
+def _send_input(inputs: "ctypes.Array[_INPUT]") -> int:
+    """Inject a batch of INPUT events with a single SendInput call. Returns events injected."""
+    if not len(inputs):
+        return 0
+    return int(_load_user32().SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT)))
+
+
+def _chord_inputs(chords: list[tuple[int, ...]]) -> "ctypes.Array[_INPUT]":
+    """Build virtual-key INPUT events for a sequence of chords, e.g. [(VK_CONTROL, VK_TAB)].
+
+    Each chord presses its keys in order and releases them in reverse; a single key
+    is a one-key chord. All events land in one preallocated array for one SendInput.
+    """
+    inputs = (_INPUT * sum(2 * len(chord) for chord in chords))()
+    i = 0
+    for chord in chords:
+        for vk, flags in [(vk, 0) for vk in chord] + [(vk, KEYEVENTF_KEYUP) for vk in reversed(chord)]:
+            inputs[i].type = INPUT_KEYBOARD
+            inputs[i].u.ki.wVk = vk
+            inputs[i].u.ki.dwFlags = flags
+            i += 1
+    return inputs
+
+
+# Detach launched editors from the server: no inherited console, and Ctrl+C/Ctrl+Break sent
+# to the server's process group does not reach them (the flags only exist on Windows)
+_SPAWN_CREATIONFLAGS = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+
+
+def spawn_notepadpp(args: list[str]) -> subprocess.Popen:
+    """Start notepad++.exe with `args` (exe first) as a detached process with no stdio pipes.
+
+    Nothing reads the editor's output, so stdio goes to DEVNULL: pipes would leak two
+    handles per launch and could block the child once their buffers filled.
+    """
+    return subprocess.Popen(
+        args,
+        shell=False,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=_SPAWN_CREATIONFLAGS,
+    )
+
+
+def _wait_for_input_idle(proc: subprocess.Popen, timeout_ms: int) -> bool:
+    """Block until a freshly started process is pumping messages. True when it is idle.
+
+    Returns False (caller should poll instead) on timeout, failure, or when the
+    Popen object carries no Windows process handle.
+    """
+    handle = getattr(proc, "_handle", None)
+    if handle is None:
+        return False
+    try:
+        return _load_user32().WaitForInputIdle(int(handle), timeout_ms) == 0
+    except Exception:
+        return False
+
+
+def _unicode_inputs(text: str) -> "ctypes.Array[_INPUT]":
+    """Build KEYEVENTF_UNICODE down/up INPUT pairs for every UTF-16 code unit of `text`.
+
+    The code units come from one encode() (surrogate pairs included, as SendInput
+    expects) and fill a preallocated INPUT array - no per-character ord() calls.
+    """
+    units = array.array("H", text.encode("utf-16-le"))
+    inputs = (_INPUT * (2 * len(units)))()
+    for i, unit in enumerate(units):
+        down, up = inputs[2 * i].u.ki, inputs[2 * i + 1].u.ki
+        inputs[2 * i].type = inputs[2 * i + 1].type = INPUT_KEYBOARD
+        down.wScan = up.wScan = unit
+        down.dwFlags = KEYEVENTF_UNICODE
+        up.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+    return inputs
+
+
+# One worker for every blocking Win32 call: calls run in submission order across all
+# controllers, and the event loop never waits on SendMessage, EnumWindows or sleeps.
+_win32_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="npp-win32")
+
+
+async def call_win32[T](fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking Win32 call on the npp-win32 worker thread and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(_win32_executor, fn, *args)
+
+
+def parse_window_title(title: str) -> tuple[str, bool]:
+    """Split a Notepad++ title ("*name - Notepad++") into (filename, modified).
+
+    rpartition makes one pass and keeps the LAST marker, so names that contain
+    " - " survive. filename is "Untitled" when the title carries no marker.
+    """
+    head, sep, _ = title.rpartition(" - Notepad++")
+    if not sep:
+        return "Untitled", False
+    head = head.strip()
+    return head.strip("*").strip() or "Untitled", head.startswith("*") or head.endswith("*")
+
+
+def win_error(e: BaseException) -> dict[str, Any]:
+    """Structured Win32 failure details for a tool response, or {} for other errors.
+
+    Follows the `raise ... from` chain, so a NotepadPPError wrapping a pywintypes.error
+    still reports it. The code/function/message are the fields the error already
+    carries (pywintypes.error args, OSError.winerror); nothing is re-formatted.
+    """
+    seen: BaseException | None = e
+    while seen is not None:
+        code = getattr(seen, "winerror", None)
+        if isinstance(code, int):
+            return {
+                "win_error": {
+                    "code": code,
+                    "func": getattr(seen, "funcname", None),
+                    "message": getattr(seen, "strerror", None) or "",
+                }
+            }
+        seen = seen.__cause__
+    return {}
+
+
+class _StopEnumeration(Exception):
+    """Raised from an EnumWindows callback to stop the enumeration early."""
 
 
 class NotepadPPError(Exception):
@@ -93,32 +342,62 @@ NOTEPADPP_TIMEOUT = int(os.getenv("NOTEPADPP_TIMEOUT", "30"))
 NOTEPADPP_AUTO_START = os.getenv("NOTEPADPP_AUTO_START", "true").lower() == "true"
 NOTEPADPP_PATH = os.getenv("NOTEPADPP_PATH", None)
 
-# Default Notepad++ installation paths
-DEFAULT_NOTEPADPP_PATHS = [
-    r"C:\Program Files\Notepad++\notepad++.exe",
-    r"C:\Program Files (x86)\Notepad++\notepad++.exe",
-    rf"C:\Users\{os.getenv('USERNAME', '')}\AppData\Local\Notepad++\notepad++.exe",
-]
+# Executable resolved by the last successful _find_notepadpp_exe(); reused by new controllers
+_notepadpp_exe: str | None = None
+
+
+def _default_notepadpp_paths() -> list[str]:
+    """Default Notepad++ install locations, built on demand (never when NOTEPADPP_PATH is set)."""
+    return [
+        r"C:\Program Files\Notepad++\notepad++.exe",
+        r"C:\Program Files (x86)\Notepad++\notepad++.exe",
+        rf"C:\Users\{os.environ.get('USERNAME', '')}\AppData\Local\Notepad++\notepad++.exe",
+    ]
 
 
 class NotepadPPController:
     """Controller for Notepad++ automation via Windows API."""
 
+    # Every tool call reads hwnd/scintilla_hwnd; slots make those plain descriptor lookups
+    __slots__ = ("_exe", "_menu_via_keys", "hwnd", "scintilla_hwnd")
+
     def __init__(self):
         if not WINDOWS_AVAILABLE:
             raise NotepadPPError("Windows API not available - this server requires Windows")
 
-        self.notepadpp_exe = self._find_notepadpp_exe()
+        # Resolved on first use: building a controller (at server import) must not probe the filesystem
+        self._exe: str | None = None
         self.hwnd = None
         self.scintilla_hwnd = None
+        # Set once WM_COMMAND is seen to have no effect (see the transport note)
+        self._menu_via_keys = False
+
+    @property
+    def notepadpp_exe(self) -> str:
+        """Notepad++ executable path, located on first access (raises NotepadPPNotFoundError)."""
+        if self._exe is None:
+            self._exe = _notepadpp_exe or self._find_notepadpp_exe()
+        return self._exe
+
+    @notepadpp_exe.setter
+    def notepadpp_exe(self, path: str) -> None:
+        self._exe = path
 
     def _find_notepadpp_exe(self) -> str:
-        """Find Notepad++ executable path."""
-        if NOTEPADPP_PATH and Path(NOTEPADPP_PATH).exists():
+        """Find Notepad++ executable path and remember it for later controllers.
+
+        An explicit NOTEPADPP_PATH is authoritative: the defaults are not probed.
+        """
+        global _notepadpp_exe
+        if NOTEPADPP_PATH:
+            if not os.path.isfile(NOTEPADPP_PATH):
+                raise NotepadPPNotFoundError(f"NOTEPADPP_PATH does not point to a file: {NOTEPADPP_PATH}")
+            _notepadpp_exe = NOTEPADPP_PATH
             return NOTEPADPP_PATH
 
-        for path in DEFAULT_NOTEPADPP_PATHS:
-            if Path(path).exists():
+        for path in _default_notepadpp_paths():
+            if os.path.isfile(path):
+                _notepadpp_exe = path
                 return path
 
         raise NotepadPPNotFoundError(
@@ -126,30 +405,58 @@ class NotepadPPController:
         )
 
     def _find_notepadpp_window(self) -> int | None:
-        """Find Notepad++ main window handle."""
+        """Find Notepad++ main window handle (the first in Z-order).
+
+        FindWindow matches the "Notepad++" class inside user32 in one call; the
+        EnumWindows walk (class or title match) only runs when that finds no visible window.
+        """
+        try:
+            hwnd = win32gui.FindWindow("Notepad++", None)
+        except Exception:  # pywin32 raises when no window matches
+            hwnd = 0
+        if hwnd and win32gui.IsWindowVisible(hwnd):
+            return hwnd
 
         def enum_windows_callback(hwnd: int, windows: list[int]) -> bool:
             if win32gui.IsWindowVisible(hwnd):
-                window_text = win32gui.GetWindowText(hwnd)
-                class_name = win32gui.GetClassName(hwnd)
-                if class_name == "Notepad++" or "Notepad++" in window_text:
+                # The class check is enough for real Notepad++ windows; the title is only read otherwise
+                if win32gui.GetClassName(hwnd) == "Notepad++" or "Notepad++" in win32gui.GetWindowText(hwnd):
                     windows.append(hwnd)
+                    # Abort the enumeration; pywin32 re-raises callback exceptions from EnumWindows
+                    raise _StopEnumeration
             return True
 
         windows: list[int] = []
-        win32gui.EnumWindows(enum_windows_callback, windows)
+        try:
+            win32gui.EnumWindows(enum_windows_callback, windows)
+        except _StopEnumeration:
+            pass
         return windows[0] if windows else None
 
     def _find_scintilla_window(self, main_hwnd: int) -> int | None:
-        """Find the editor Scintilla window within Notepad++ (first non-empty buffer)."""
+        """Find the editor Scintilla window within Notepad++ (first non-empty buffer).
+
+        The two edit views are direct children of the main window, so FindWindowEx
+        walks just those; the full EnumChildWindows scan is the fallback.
+        """
         candidates: list[int] = []
+        child = 0
+        while True:
+            try:
+                child = win32gui.FindWindowEx(main_hwnd, child, "Scintilla", None)
+            except Exception:  # pywin32 raises when no further window matches
+                child = 0
+            if not child:
+                break
+            candidates.append(child)
 
         def enum_child_windows(hwnd: int, scintilla_windows: list[int]) -> bool:
             if win32gui.GetClassName(hwnd) == "Scintilla":
                 scintilla_windows.append(hwnd)
             return True
 
-        win32gui.EnumChildWindows(main_hwnd, enum_child_windows, candidates)
+        if not candidates:
+            win32gui.EnumChildWindows(main_hwnd, enum_child_windows, candidates)
         if not candidates:
             return None
         # Prefer the Scintilla with content (editor) over dialog-internal ones.
@@ -165,34 +472,84 @@ class NotepadPPController:
                 best = hwnd
         return best
 
+    def _handles_valid(self) -> bool:
+        """True when the cached main and Scintilla handles still refer to live windows."""
+        if not (self.hwnd and self.scintilla_hwnd):
+            return False
+        try:
+            return bool(win32gui.IsWindow(self.hwnd) and win32gui.IsWindow(self.scintilla_hwnd))
+        except Exception:
+            return False
+
     async def ensure_notepadpp_running(self) -> bool:
-        """Ensure Notepad++ is running, start if needed."""
-        self.hwnd = self._find_notepadpp_window()
+        """Ensure Notepad++ is running, start if needed.
+
+        Cached handles are reused while both windows still exist, so repeat
+        calls skip the EnumWindows/EnumChildWindows scan.
+        """
+        if await self._call(self._handles_valid):
+            return True
+
+        self.hwnd = await self._call(self._find_notepadpp_window)
 
         if not self.hwnd and NOTEPADPP_AUTO_START:
-            subprocess.Popen([self.notepadpp_exe], shell=False)
-            for _ in range(50):  # 5 seconds max
-                await asyncio.sleep(0.1)
-                self.hwnd = self._find_notepadpp_window()
-                if self.hwnd:
-                    break
+            proc = await self._call(spawn_notepadpp, [self.notepadpp_exe])
+            # Wait in the kernel for the message pump, then look once; the main
+            # window can still trail input-idle slightly, so back off from there.
+            if await self._call(_wait_for_input_idle, proc, 5000):
+                self.hwnd = await self._call(self._find_notepadpp_window)
+            delay, waited = 0.01, 0.0
+            while not self.hwnd and waited < 5.0:  # 5 seconds max
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = min(delay * 2, 0.32)
+                self.hwnd = await self._call(self._find_notepadpp_window)
 
         if not self.hwnd:
             raise NotepadPPNotFoundError("Notepad++ is not running and auto-start failed")
 
-        self.scintilla_hwnd = self._find_scintilla_window(self.hwnd)
+        self.scintilla_hwnd = await self._call(self._find_scintilla_window, self.hwnd)
         if not self.scintilla_hwnd:
             raise NotepadPPError("Could not find Scintilla editor window")
 
         return True
 
+    async def _call[T](self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking Win32 call on the shared npp-win32 worker (see call_win32)."""
+        return await call_win32(fn, *args)
+
     async def send_message(self, hwnd: int, msg: int, wparam: int = 0, lparam: int = 0) -> int:
-        """Send Windows message to window."""
+        """Send Windows message to window (dispatched off the event loop)."""
         try:
-            return _send_message_w(hwnd, msg, wparam, lparam)
+            return await self._call(_send_message_w, hwnd, msg, wparam, lparam)
         except Exception as e:
             raise NotepadPPError(f"Failed to send message: {e}") from e
 
+    async def send_messages(self, hwnd: int, messages: list[tuple[int, int, int]]) -> list[int]:
+        """Send an ordered batch of (msg, wparam, lparam) messages in one worker hop.
+
+        Order is preserved (e.g. WM_KEYDOWN before WM_KEYUP), so the batch is
+        pipelined rather than gathered.
+        """
+
+        def _dispatch() -> list[int]:
+            return [_send_message_w(hwnd, msg, wparam, lparam) for msg, wparam, lparam in messages]
+
+        try:
+            return await self._call(_dispatch)
+        except Exception as e:
+            raise NotepadPPError(f"Failed to send messages: {e}") from e
+
+    async def post_message(self, hwnd: int, msg: int, wparam: int = 0, lparam: int = 0) -> bool:
+        """Post a Windows message (fire-and-forget; does not wait for the target's message pump)."""
+        try:
+            posted = await self._call(_post_message_w, hwnd, msg, wparam, lparam)
+        except Exception as e:
+            raise NotepadPPError(f"Failed to post message: {e}") from e
+        if not posted:
+            raise NotepadPPError("Failed to post message: target window rejected it")
+        return True
+
     def get_window_text(self, hwnd: int) -> str:
         """Get caption text for a window (title bar)."""
         try:
@@ -241,28 +598,37 @@ class NotepadPPController:
     # ------------------------------------------------------------------
 
     def _find_modal_dialog(self) -> int | None:
-        """Find a modal #32770 dialog owned by the Notepad++ process."""
+        """Find a modal #32770 dialog created by the Notepad++ UI thread.
+
+        Only that thread's top-level windows are enumerated (a handful), not every
+        window on the desktop, and the walk stops at the first dialog.
+        """
         if not self.hwnd:
             return None
         try:
             import win32process
 
-            _, npp_pid = win32process.GetWindowThreadProcessId(self.hwnd)
+            npp_tid, _ = win32process.GetWindowThreadProcessId(self.hwnd)
         except Exception:
             return None
         found: list[int] = []
 
         def cb(hwnd: int, _lparam) -> bool:
             try:
-                if win32gui.GetClassName(hwnd) == "#32770":
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    if pid == npp_pid:
-                        found.append(hwnd)
+                is_dialog = win32gui.GetClassName(hwnd) == "#32770"
             except Exception:
-                pass
+                return True
+            if is_dialog:
+                found.append(hwnd)
+                raise _StopEnumeration
             return True
 
-        win32gui.EnumWindows(cb, None)
+        try:
+            win32gui.EnumThreadWindows(npp_tid, cb, None)
+        except _StopEnumeration:
+            pass
+        except Exception:
+            return None
         return found[0] if found else None
 
     def has_modal_dialog(self) -> bool:
@@ -272,8 +638,10 @@ class NotepadPPController:
     def dismiss_save_dialog(self, choice: str = "no") -> bool:
         """Click a button on the NPP modal dialog (No/Cancel/Yes) via BM_CLICK.
 
-        Deterministic - no foreground required. Returns True when a button
-        was clicked. 'no' = close without saving (discard), 'yes' = save.
+        Deterministic - no foreground required. Returns True when the click was
+        queued. 'no' = close without saving (discard), 'yes' = save. The click is
+        posted: 'yes' on an untitled tab opens Save As, and a sent BM_CLICK would
+        not return until that nested dialog closed.
         """
         dlg = self._find_modal_dialog()
         if not dlg:
@@ -292,13 +660,11 @@ class NotepadPPController:
         for hwnd, text in buttons:
             # Buttons carry accelerator prefixes: "&No" -> "No"
             if text.replace("&", "").strip().lower() == choice.lower():
-                _send_message_w(hwnd, 0x00F5, 0, 0)  # BM_CLICK
-                return True
+                return _post_message_w(hwnd, BM_CLICK, 0, 0)
         # Fallback: Cancel (safe default - aborts the dialog)
         for hwnd, text in buttons:
             if text.replace("&", "").strip().lower() == "cancel":
-                _send_message_w(hwnd, 0x00F5, 0, 0)
-                return True
+                return _post_message_w(hwnd, BM_CLICK, 0, 0)
         return False
 
     def _bring_to_foreground(self) -> bool:
@@ -332,33 +698,30 @@ class NotepadPPController:
         except Exception:
             return False
 
-    def _key_chord(self, keys: list[str]) -> None:
-        """Simulate a key chord (e.g. ['ctrl', 'v']) on the foreground window."""
-        mods = {
-            "ctrl": win32con.VK_CONTROL,
-            "shift": win32con.VK_SHIFT,
-            "alt": win32con.VK_MENU,
-        }
-        down: list[int] = []
-        try:
-            for key in keys:
-                code = mods.get(key)
-                if code is not None:
-                    win32api.keybd_event(code, 0, 0, 0)
-                    down.append(code)
-                else:
-                    vk = ord(key.upper()) if len(key) == 1 else getattr(win32con, f"VK_{key.upper()}", 0)
-                    if vk:
-                        win32api.keybd_event(vk, 0, 0, 0)
-                        win32api.keybd_event(vk, 0, win32con.KEYEVENTF_KEYUP, 0)
-            time.sleep(0.05)
-        finally:
-            for code in reversed(down):
-                win32api.keybd_event(code, 0, win32con.KEYEVENTF_KEYUP, 0)
+    def type_text(self, text: str) -> bool:
+        """Type text into the editor as Unicode keystrokes with one SendInput batch.
 
-    def _clipboard_set(self, text: str) -> None:
-        import win32clipboard
+        Needs the editor foreground. Returns True when every event was injected.
+        """
+        if not self._bring_to_foreground():
+            return False
+        time.sleep(0.15)
+        inputs = _unicode_inputs(text)
+        return _send_input(inputs) == len(inputs)
+
+    def send_chords(self, chords: list[tuple[int, ...]]) -> bool:
+        """Inject key chords (see _chord_inputs) into the foreground window with one SendInput.
 
+        The batch cannot interleave with real keypresses. Returns True when every event was injected.
+        """
+        inputs = _chord_inputs(chords)
+        return _send_input(inputs) == len(inputs)
+
+    def send_hotkey(self, *vks: int, repeat: int = 1) -> bool:
+        """Press a hotkey such as Ctrl+Tab `repeat` times in one SendInput batch."""
+        return self.send_chords([vks] * repeat)
+
+    def _clipboard_set(self, text: str) -> None:
         win32clipboard.OpenClipboard()
         try:
             win32clipboard.EmptyClipboard()
@@ -367,8 +730,6 @@ class NotepadPPController:
             win32clipboard.CloseClipboard()
 
     def _clipboard_get(self) -> str:
-        import win32clipboard
-
         win32clipboard.OpenClipboard()
         try:
             if win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
@@ -377,79 +738,132 @@ class NotepadPPController:
         finally:
             win32clipboard.CloseClipboard()
 
-    def paste_text(self, text: str) -> bool:
-        """Set the clipboard and paste into the editor (needs foreground). Returns success."""
+    def _menu_command(self, command_id: int) -> bool:
+        """Run a Notepad++ menu command and wait for it to finish. Returns success.
+
+        SendMessage returns once the command has run, so no settle delay is needed.
+        Only for commands that never open a modal dialog (the call would block on it).
+        """
+        if not self.hwnd:
+            return False
+        try:
+            _send_message_w(self.hwnd, WM_COMMAND, command_id, 0)
+        except Exception:
+            return False
+        return True
+
+    def _post_menu_command(self, command_id: int) -> bool:
+        """Queue a Notepad++ menu command without waiting (safe when it may open a dialog)."""
+        if not self.hwnd:
+            return False
+        try:
+            return _post_message_w(self.hwnd, WM_COMMAND, command_id, 0)
+        except Exception:
+            return False
+
+    def run_menu_command(self, name: str) -> bool:
+        """Run a named Notepad++ menu command from NPP_MENU_COMMANDS. Returns success.
+
+        Commands that can open a modal dialog are queued; the rest have finished on return.
+        """
+        if self._menu_via_keys and name in _MENU_COMMAND_KEYS:
+            return self._menu_keys(name)
+        command_id = NPP_MENU_COMMANDS[name]
+        if name in _POSTED_MENU_COMMANDS:
+            return self._post_menu_command(command_id)
+        return self._menu_command(command_id)
+
+    def _menu_keys(self, name: str) -> bool:
+        """Run a menu command by its keyboard accelerator (needs foreground). Returns success."""
+        chord, settle = _MENU_COMMAND_KEYS[name]
         if not self._bring_to_foreground():
             return False
         time.sleep(0.15)
+        sent = self.send_chords([chord])
+        time.sleep(settle)
+        return sent
+
+    def paste_text(self, text: str) -> bool:
+        """Set the clipboard and paste into the active view. Returns success."""
         self._clipboard_set(text)
-        time.sleep(0.15)
-        self._key_chord(["ctrl", "v"])
-        time.sleep(0.3)
-        return True
+        return self.run_menu_command("paste")
 
     def select_all(self) -> bool:
-        """Ctrl+A in the editor (needs foreground). Returns success."""
-        if not self._bring_to_foreground():
+        """Edit > Select All in the active view. Returns success.
+
+        The first command seen to do nothing (a non-empty buffer left unselected)
+        switches this controller to keystrokes and is retried that way.
+        """
+        if not self.run_menu_command("select_all"):
             return False
-        time.sleep(0.15)
-        self._key_chord(["ctrl", "a"])
-        time.sleep(0.15)
+        if self._menu_via_keys:
+            return True
+        try:
+            length = self.get_buffer_length()
+            selected = self.get_selection() == (0, length)
+        except Exception:
+            return True  # cannot check; keep WM_COMMAND
+        if length and not selected:
+            self._menu_via_keys = True
+            return self.run_menu_command("select_all")
         return True
 
     def copy_selection_to_clipboard(self) -> bool:
-        """Ctrl+C in the editor (needs foreground). Returns success."""
-        if not self._bring_to_foreground():
-            return False
-        time.sleep(0.15)
-        self._key_chord(["ctrl", "c"])
-        time.sleep(0.2)
-        return True
+        """Edit > Copy in the active view. Returns success."""
+        return self.run_menu_command("copy")
 
     def new_document(self) -> bool:
-        """File > New via keystroke (needs foreground). Returns success."""
-        if not self._bring_to_foreground():
+        """File > New. Returns success."""
+        return self.run_menu_command("new")
+
+    def open_file(self, path: str) -> bool:
+        """Open `path` in the running editor. Returns True once it has been handed over.
+
+        Sends the path as WM_COPYDATA, exactly what a second notepad++.exe would forward,
+        and returns after Notepad++ has loaded it. Falls back to launching notepad++.exe
+        (and waiting briefly for the launcher to exit) when the message is not accepted,
+        e.g. when the editor runs elevated and UIPI drops it.
+        """
+        if self.hwnd:
+            # Parsed as a command line, so the path is quoted for names with spaces
+            data = ctypes.create_unicode_buffer(f'"{path}"')
+            cds = _COPYDATASTRUCT(COPYDATA_FILENAMESW, ctypes.sizeof(data), ctypes.addressof(data))
+            try:
+                if _send_message_w(self.hwnd, WM_COPYDATA, 0, ctypes.addressof(cds)):
+                    return True
+            except Exception:
+                pass
+        try:
+            proc = spawn_notepadpp([self.notepadpp_exe, path])
+        except (OSError, NotepadPPError):
             return False
-        time.sleep(0.15)
-        self._key_chord(["ctrl", "n"])
-        time.sleep(0.3)
+        try:
+            proc.wait(1.0)
+        except subprocess.TimeoutExpired:
+            pass  # multi-instance mode keeps the launcher alive
         return True
 
+    def close_current(self) -> bool:
+        """File > Close. Posted, because a dirty tab opens the modal save prompt."""
+        return self.run_menu_command("close")
+
     def save_current(self) -> bool:
-        """File > Save via keystroke (needs foreground). Returns success."""
-        if not self._bring_to_foreground():
-            return False
-        time.sleep(0.15)
-        self._key_chord(["ctrl", "s"])
-        time.sleep(0.3)
-        return True
+        """File > Save. Posted, because an untitled tab opens the modal Save As dialog."""
+        return self.run_menu_command("save")
 
     # ------------------------------------------------------------------
     # Text read/write with verify-after (honest - never fake success)
     # ------------------------------------------------------------------
 
     def get_current_file_path(self) -> str:
-        """Full path of the active buffer: NPPM message first, then the window title."""
-        try:
-            size = 512
-            buf = ctypes.create_string_buffer(size)
-            result = _send_message_w(self.hwnd or 0, NPPM_GETFULLCURRENTPATH, size, ctypes.cast(buf, ctypes.c_char_p))
-            if result and result < size:
-                path = buf.value.decode("utf-8", errors="replace")
-                if path and os.path.exists(path):
-                    return path
-        except Exception:
-            pass
-        # Title fallback: Notepad++ often shows the full path in the title.
+        """Full path of the active buffer, parsed from the window title ("" if not shown).
+
+        NPPM_GETFULLCURRENTPATH would make Notepad++ write to a buffer address that is
+        only valid in our process, so it is not used (see the transport note).
+        """
+        # Notepad++ often shows the full path in the title.
         try:
-            title = win32gui.GetWindowText(self.hwnd) or ""
-            marker = " - Notepad++"
-            if marker in title:
-                title = title.split(marker)[0]
-            name = title[1:] if title.startswith("*") else title
-            if name.endswith("*"):
-                name = name[:-1]
-            name = name.strip()
+            name, _ = parse_window_title(win32gui.GetWindowText(self.hwnd) or "")
         except Exception:
             name = ""
         if name and os.path.isabs(name) and os.path.exists(name):
@@ -462,16 +876,8 @@ class NotepadPPController:
             title = win32gui.GetWindowText(self.hwnd) or ""
         except Exception:
             title = ""
-        rest = title
-        marker = " - Notepad++"
-        if marker in title:
-            rest = title.split(marker)[0]
-        dirty = rest.startswith("*") or rest.endswith("*")
-        filename = rest[1:] if rest.startswith("*") else rest
-        if filename.endswith("*"):
-            filename = filename[:-1]
-        filename = filename.strip()
-        untitled = not filename or filename.lower().startswith("new ") or filename.lower() == "untitled"
+        filename, dirty = parse_window_title(title)
+        untitled = filename.lower().startswith("new ") or filename.lower() == "untitled"
         return {
             "title": title,
             "filename": filename,
@@ -506,15 +912,8 @@ class NotepadPPController:
     def set_buffer_text(self, text: str) -> bool:
         """Replace the whole buffer. Clipboard is set FIRST so the paste cannot
         race with a stale clipboard left by a previous verify/copy step."""
-        if not self._bring_to_foreground():
-            return False
         self._clipboard_set(text)
-        time.sleep(0.15)
-        self._key_chord(["ctrl", "a"])
-        time.sleep(0.2)
-        self._key_chord(["ctrl", "v"])
-        time.sleep(0.5)  # let the paste land before verification
-        return True
+        return self.run_menu_command("select_all") and self.run_menu_command("paste")
 
     def insert_at_caret(self, text: str) -> bool:
         """Paste text at the caret (replaces any selection). Returns success."""
@@ -525,6 +924,15 @@ class NotepadPPController:
 
         Use for post-edit verification; get_buffer_text() reads disk for named files.
         """
+        return self._copy_buffer()
+
+    def _copy_buffer(self) -> str:
+        """Select All + Copy the active view and return the copied text ("" on failure).
+
+        The clipboard is emptied first, so a copy that did not happen reads as ""
+        rather than as whatever was on the clipboard (e.g. the text just pasted).
+        """
+        self._clipboard_set("")
         if self.select_all() and self.copy_selection_to_clipboard():
             return self._clipboard_get()
         return ""
@@ -533,16 +941,15 @@ class NotepadPPController:
         """Verify the buffer now holds `expected` (clipboard round-trip: select-all + copy).
 
         Line endings are normalized (Notepad++ stores CRLF; expected text may use LF).
-        Retries twice to absorb editor/foreground timing jitter.
+        Retries twice to absorb editor timing jitter.
         """
 
         def _norm(s: str) -> str:
             return s.replace("\r\n", "\n").replace("\r", "\n")
 
         for _ in range(3):
-            if self.select_all() and self.copy_selection_to_clipboard():
-                if _norm(self._clipboard_get()) == _norm(expected):
-                    return True
+            if _norm(self._copy_buffer()) == _norm(expected):
+                return True
             time.sleep(0.3)
         return False
 
@@ -561,6 +968,7 @@ def handle_tool_errors(func):
                 "error": str(e),
                 "error_code": "NOTEPADPP_NOT_FOUND",
                 "message": f"Notepad++ is not running or could not be found: {e}",
+                **win_error(e),
             }
         except NotepadPPError as e:
             return {
@@ -568,6 +976,7 @@ def handle_tool_errors(func):
                 "error": str(e),
                 "error_code": "NOTEPADPP_ERROR",
                 "message": f"An error occurred during Notepad++ automation: {e}",
+                **win_error(e),
             }
         except Exception as e:
             return {
@@ -575,6 +984,7 @@ def handle_tool_errors(func):
                 "error": str(e),
                 "error_code": "UNKNOWN_ERROR",
                 "message": f"An unexpected error occurred: {e}",
+                **win_error(e),
             }
 
     return wrapper
@@ -5,24 +5,22 @@ Consolidates display operations (invisible text fixes, display issue fixes) into
 Theme / dark mode: edits %APPDATA%\\Notepad++\\config.xml (GUIConfig DarkMode); restart Notepad++ to apply.
 """
 
-import asyncio
 from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from pydantic import Field
 
 from ..npp_theme import patch_config_xml, read_theme_state, theme_status_payload
+from .controller import NPP_MENU_COMMANDS, WM_COMMAND, call_win32, win_error
 
 # Windows-specific imports
 try:
-    import win32api
     import win32con
     import win32gui
 
     WINDOWS_AVAILABLE = True
 except ImportError:
     WINDOWS_AVAILABLE = False
-    win32api: Any = None
     win32con: Any = None
     win32gui: Any = None
 
@@ -195,25 +193,16 @@ class DisplayOperationsTool:
                 await self.controller.ensure_notepadpp_running()
 
                 if operation == "fix_invisible_text":
-                    # Focus on Notepad++
-                    win32gui.SetForegroundWindow(self.controller.hwnd)
-                    await asyncio.sleep(0.1)
-
-                    # Method 1: Quick theme reset via Style Configurator
-                    # Open Settings menu with Alt+S
-                    keybd_event = win32api.keybd_event
-                    keybd_event(win32con.VK_MENU, 0, 0, 0)  # Alt key
-                    keybd_event(ord("S"), 0, 0, 0)
-                    keybd_event(ord("S"), 0, win32con.KEYEVENTF_KEYUP, 0)
-                    keybd_event(win32con.VK_MENU, 0, win32con.KEYEVENTF_KEYUP, 0)
-
-                    await asyncio.sleep(0.5)
-
-                    # Press 'S' for Style Configurator
-                    keybd_event(ord("S"), 0, 0, 0)
-                    keybd_event(ord("S"), 0, win32con.KEYEVENTF_KEYUP, 0)
-
-                    await asyncio.sleep(1.0)
+                    # Settings > Style Configurator as a menu command: no focus, keystrokes or
+                    # delays. Posted, since the command only returns once the dialog is up.
+                    if not await call_win32(self.controller.run_menu_command, "style_configurator"):
+                        return {
+                            "success": False,
+                            "error": "editor_unavailable",
+                            "operation": operation,
+                            "summary": "Could not reach the Notepad++ window - theme reset aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
+                        }
 
                     return {
                         "success": True,
@@ -236,18 +225,24 @@ class DisplayOperationsTool:
                     }
 
                 if operation == "fix_display_issue":
-                    # Focus on Notepad++
-                    win32gui.SetForegroundWindow(self.controller.hwnd)
-                    await asyncio.sleep(0.1)
-
-                    # Attempt to refresh the display
-                    keybd_event = win32api.keybd_event
-                    keybd_event(win32con.VK_CONTROL, 0, 0, 0)
-                    keybd_event(ord("L"), 0, 0, 0)
-                    keybd_event(ord("L"), 0, win32con.KEYEVENTF_KEYUP, 0)
-                    keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
-
-                    await asyncio.sleep(0.5)
+                    # Freeze painting, reset the zoom, unfreeze - one worker hop, in order -
+                    # then repaint the frame and every child (tabs, Scintilla views) once.
+                    hwnd = self.controller.hwnd
+                    await self.controller.send_messages(
+                        hwnd,
+                        [
+                            (win32con.WM_SETREDRAW, 0, 0),
+                            (WM_COMMAND, NPP_MENU_COMMANDS["reset_zoom"], 0),
+                            (win32con.WM_SETREDRAW, 1, 0),
+                        ],
+                    )
+                    await call_win32(
+                        win32gui.RedrawWindow,
+                        hwnd,
+                        None,
+                        None,
+                        win32con.RDW_ERASE | win32con.RDW_FRAME | win32con.RDW_INVALIDATE | win32con.RDW_ALLCHILDREN,
+                    )
 
                     return {
                         "success": True,
@@ -255,6 +250,7 @@ class DisplayOperationsTool:
                         "summary": "Attempted to fix display issues",
                         "result": {
                             "display_refresh_attempted": True,
+                            "zoom_reset": True,
                             "method": "redraw",
                         },
                         "next_steps": [
@@ -299,6 +295,7 @@ class DisplayOperationsTool:
                     "success": False,
                     "error": f"Display operation failed: {e}",
                     "operation": operation,
+                    **win_error(e),
                     "summary": f"Display operation '{operation}' encountered an error",
                     "recovery_options": [
                         "Check Notepad++ is running",
@@ -9,13 +9,14 @@ import datetime
 import difflib
 import os
 import re
-import subprocess
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from pydantic import Field
 
+from .controller import call_win32, win_error
+
 # Windows-specific imports
 try:
     import win32api
@@ -212,16 +213,15 @@ class FileOperationsTool:
                             ],
                         }
 
-                    # Use subprocess to open file (Notepad++ command line)
-                    subprocess.Popen(
-                        [self.controller.notepadpp_exe, abs_path],
-                        shell=False,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
-
-                    # Wait a moment for file to load
-                    await asyncio.sleep(0.5)
+                    # Hand the path to the running instance (WM_COPYDATA; returns once loaded)
+                    if not await call_win32(self.controller.open_file, abs_path):
+                        return {
+                            "success": False,
+                            "error": "editor_unavailable",
+                            "operation": operation,
+                            "summary": f"Could not hand '{os.path.basename(abs_path)}' to Notepad++ - open aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
+                        }
 
                     return {
                         "success": True,
@@ -257,16 +257,15 @@ class FileOperationsTool:
                     }
 
                 elif operation == "new":
-                    # File > New (Ctrl+N) - creates an untitled tab
-                    if not self.controller.new_document():
+                    # File > New - creates an untitled tab (synchronous, no settle delay)
+                    if not await call_win32(self.controller.new_document):
                         return {
                             "success": False,
-                            "error": "foreground_unavailable",
+                            "error": "editor_unavailable",
                             "operation": operation,
-                            "summary": "Could not bring the editor to the foreground - new tab aborted",
-                            "recovery_options": ["Bring Notepad++ to the foreground and retry"],
+                            "summary": "Could not reach the Notepad++ window - new tab aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
                         }
-                    await asyncio.sleep(0.3)
 
                     return {
                         "success": True,
@@ -301,7 +300,7 @@ class FileOperationsTool:
                     }
 
                 elif operation == "save":
-                    tab_state = self.controller.get_active_tab_state()
+                    tab_state = await call_win32(self.controller.get_active_tab_state)
                     backup_path = None
                     disk_path = tab_state.get("path") or ""
                     if backup and disk_path and os.path.exists(disk_path) and not tab_state["untitled"]:
@@ -313,14 +312,14 @@ class FileOperationsTool:
                                 dst.write(src.read())
                         except OSError:
                             backup_path = None
-                    # Save via File > Save (Ctrl+S)
-                    if not self.controller.save_current():
+                    # Save via File > Save (posted; give it a moment to land)
+                    if not await call_win32(self.controller.save_current):
                         return {
                             "success": False,
-                            "error": "foreground_unavailable",
+                            "error": "editor_unavailable",
                             "operation": operation,
-                            "summary": "Could not bring the editor to the foreground - save aborted",
-                            "recovery_options": ["Bring Notepad++ to the foreground and retry"],
+                            "summary": "Could not reach the Notepad++ window - save aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
                         }
                     await asyncio.sleep(0.3)
 
@@ -359,7 +358,7 @@ class FileOperationsTool:
                     }
 
                 elif operation == "info":
-                    tab_state = self.controller.get_active_tab_state()
+                    tab_state = await call_win32(self.controller.get_active_tab_state)
                     filename = tab_state["filename"] or "Untitled"
                     is_modified = tab_state["dirty"]
                     disk_path = tab_state.get("path") or ""
@@ -424,7 +423,7 @@ class FileOperationsTool:
                     }
 
                 elif operation == "is_dirty":
-                    tab_state = self.controller.get_active_tab_state()
+                    tab_state = await call_win32(self.controller.get_active_tab_state)
                     return {
                         "success": True,
                         "operation": operation,
@@ -470,22 +469,20 @@ class FileOperationsTool:
                                 "Choose a different file_path",
                             ],
                         }
-                    buffer_text, _source = self.controller.get_buffer_text()
+                    buffer_text, _source = await call_win32(self.controller.get_buffer_text)
                     with open(abs_path, "w", encoding="utf-8", newline="") as f:
                         f.write(buffer_text)
                     # Open the saved file in Notepad++ so the app switches to it
-                    subprocess.Popen(
-                        [self.controller.notepadpp_exe, abs_path],
-                        shell=False,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
-                    await asyncio.sleep(0.5)
+                    opened = await call_win32(self.controller.open_file, abs_path)
                     return {
                         "success": True,
                         "operation": operation,
                         "summary": f"Saved buffer to {abs_path} ({len(buffer_text)} chars)",
-                        "result": {"file_path": abs_path, "written_chars": len(buffer_text), "opened_in_editor": True},
+                        "result": {
+                            "file_path": abs_path,
+                            "written_chars": len(buffer_text),
+                            "opened_in_editor": opened,
+                        },
                         "next_steps": [
                             "Close the old untitled tab if it is still open: tab_ops(operation='close')",
                             "Continue editing in the newly opened tab",
@@ -510,7 +507,7 @@ class FileOperationsTool:
                             "summary": f"File not found: {abs_path}",
                             "recovery_options": ["Check the path", "Use file_ops open to create/load it"],
                         }
-                    tab_state = self.controller.get_active_tab_state()
+                    tab_state = await call_win32(self.controller.get_active_tab_state)
                     if tab_state["dirty"] and not force:
                         return {
                             "success": False,
@@ -525,15 +522,15 @@ class FileOperationsTool:
                         }
                     with open(abs_path, encoding="utf-8", errors="replace") as f:
                         disk_text = f.read()
-                    if not self.controller.set_buffer_text(disk_text):
+                    if not await call_win32(self.controller.set_buffer_text, disk_text):
                         return {
                             "success": False,
-                            "error": "foreground_unavailable",
+                            "error": "editor_unavailable",
                             "operation": operation,
-                            "summary": "Could not bring the editor to the foreground - reload aborted",
-                            "recovery_options": ["Bring Notepad++ to the foreground and retry"],
+                            "summary": "Could not reach the Notepad++ window - reload aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
                         }
-                    if not self.controller.verify_buffer(disk_text):
+                    if not await call_win32(self.controller.verify_buffer, disk_text):
                         return {
                             "success": False,
                             "error": "verification_failed",
@@ -638,7 +635,7 @@ class FileOperationsTool:
                             "operation": operation,
                             "summary": f"File not found: {abs_path}",
                         }
-                    buffer_text, _source = self.controller.get_buffer_text()
+                    buffer_text, _source = await call_win32(self.controller.get_buffer_text)
                     with open(abs_path, encoding="utf-8", errors="replace") as f:
                         disk_text = f.read()
                     if buffer_text == disk_text:
@@ -704,6 +701,7 @@ class FileOperationsTool:
                     "success": False,
                     "error": f"File operation failed: {e}",
                     "operation": operation,
+                    **win_error(e),
                     "summary": f"File operation '{operation}' encountered an error",
                     "recovery_options": [
                         "Check Notepad++ is running",
@@ -22,17 +22,16 @@ from ..plugin_catalog import (
     one_line_description,
     plugin_list_url,
 )
+from .controller import call_win32, win_error
 
 # Windows-specific imports
 try:
-    import win32api
     import win32con
     import win32gui
 
     WINDOWS_AVAILABLE = True
 except ImportError:
     WINDOWS_AVAILABLE = False
-    win32api: Any = None
     win32con: Any = None
     win32gui: Any = None
 
@@ -512,32 +511,21 @@ class PluginOperationsTool:
                     await self.controller.ensure_notepadpp_running()
 
                     # Focus on Notepad++
-                    win32gui.SetForegroundWindow(self.controller.hwnd)
+                    await call_win32(win32gui.SetForegroundWindow, self.controller.hwnd)
                     await asyncio.sleep(0.1)
 
                     # Open Plugins menu with Alt+P
-                    keybd_event = win32api.keybd_event
-                    keybd_event(win32con.VK_MENU, 0, 0, 0)  # Alt key
-                    keybd_event(ord("P"), 0, 0, 0)
-                    keybd_event(ord("P"), 0, win32con.KEYEVENTF_KEYUP, 0)
-                    keybd_event(win32con.VK_MENU, 0, win32con.KEYEVENTF_KEYUP, 0)
+                    await call_win32(self.controller.send_hotkey, win32con.VK_MENU, ord("P"))
 
                     await asyncio.sleep(0.5)
 
                     # Navigate to the plugin submenu
                     # (This is a simplified version - full navigation would need menu structure knowledge)
 
-                    # Type the command name
-                    for char in command:
-                        keybd_event(ord(char.upper()), 0, 0, 0)
-                        keybd_event(ord(char.upper()), 0, win32con.KEYEVENTF_KEYUP, 0)
-                        await asyncio.sleep(0.1)
-
-                    await asyncio.sleep(0.5)
-
-                    # Press Enter to execute
-                    keybd_event(win32con.VK_RETURN, 0, 0, 0)
-                    keybd_event(win32con.VK_RETURN, 0, win32con.KEYEVENTF_KEYUP, 0)
+                    # Type the command name and press Enter, as one SendInput batch (the menu loop
+                    # consumes queued input in order, so no per-key delay is needed)
+                    keys = [(ord(char.upper()),) for char in command] + [(win32con.VK_RETURN,)]
+                    await call_win32(self.controller.send_chords, keys)
 
                     await asyncio.sleep(1.0)
 
@@ -563,6 +551,7 @@ class PluginOperationsTool:
                         "success": False,
                         "error": f"Plugin execute failed: {e}",
                         "operation": operation,
+                        **win_error(e),
                         "plugin_name": plugin_name,
                         "command": command,
                         "summary": "Failed to execute plugin command",
@@ -22,6 +22,7 @@ from typing import Any
 
 from fastmcp import FastMCP
 
+from .controller import WINDOWS_AVAILABLE, NotepadPPController
 from .display_operations import DisplayOperationsTool
 
 # Tool imports
@@ -33,22 +34,6 @@ from .status_operations import StatusOperationsTool
 from .tab_operations import TabOperationsTool
 from .text_operations import TextOperationsTool
 
-# Windows-specific imports for controller
-try:
-    import win32api
-    import win32con
-    import win32gui
-
-    WINDOWS_AVAILABLE = True
-except ImportError:
-    WINDOWS_AVAILABLE = False
-    win32api: Any = None
-    win32con: Any = None
-    win32gui: Any = None
-
-# Import the Notepad++ controller and error classes/decorators
-from .controller import NotepadPPController
-
 # Global controller instance
 controller = NotepadPPController() if WINDOWS_AVAILABLE else None
 
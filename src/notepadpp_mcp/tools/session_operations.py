@@ -13,7 +13,8 @@ from fastmcp import FastMCP
 from pydantic import Field
 
 from .. import npp_session_store
-from ..editor_bridge import normalize_title_filename, try_resolve_path_from_hint
+from ..editor_bridge import try_resolve_path_from_hint
+from .controller import call_win32, parse_window_title, win_error
 
 
 class SessionOperationsTool:
@@ -94,15 +95,12 @@ class SessionOperationsTool:
                             },
                         }
 
-                    window_text = self.controller.get_window_text(self.controller.hwnd)
+                    window_text = await call_win32(self.controller.get_window_text, self.controller.hwnd)
                     fallback: list[str] = []
-                    if " - Notepad++" in window_text:
-                        fn = normalize_title_filename(
-                            window_text.split(" - Notepad++")[0],
-                        )
-                        resolved = try_resolve_path_from_hint(fn)
-                        if resolved:
-                            fallback.append(resolved)
+                    fn, _ = parse_window_title(window_text)
+                    resolved = try_resolve_path_from_hint(fn)
+                    if resolved:
+                        fallback.append(resolved)
 
                     try:
                         result = await asyncio.to_thread(
@@ -226,6 +224,7 @@ class SessionOperationsTool:
                     "success": False,
                     "error": f"Session operation failed: {e}",
                     "operation": operation,
+                    **win_error(e),
                     "summary": f"Session operation '{operation}' encountered an error",
                     "recovery_options": [
                         "Check Notepad++ is running",
@@ -10,6 +10,8 @@ from typing import Annotated, Any, Literal
 from fastmcp import FastMCP
 from pydantic import Field
 
+from .controller import call_win32
+
 # Windows-specific imports
 try:
     import psutil
@@ -287,9 +289,9 @@ class StatusOperationsTool:
                 try:
                     await self.controller.ensure_notepadpp_running()
                     editor["running"] = True
-                    editor.update(self.controller.get_active_tab_state())
-                    editor["line_count"] = self.controller.get_line_count()
-                    editor["buffer_length"] = self.controller.get_buffer_length()
+                    editor.update(await call_win32(self.controller.get_active_tab_state))
+                    editor["line_count"] = await call_win32(self.controller.get_line_count)
+                    editor["buffer_length"] = await call_win32(self.controller.get_buffer_length)
                 except Exception as e:
                     editor["running"] = False
                     editor["error"] = str(e)
@@ -10,16 +10,16 @@ from typing import Annotated, Any, Literal
 from fastmcp import FastMCP
 from pydantic import Field
 
+from .controller import call_win32, parse_window_title, win_error
+
 # Windows-specific imports
 try:
-    import win32api
     import win32con
     import win32gui
 
     WINDOWS_AVAILABLE = True
 except ImportError:
     WINDOWS_AVAILABLE = False
-    win32api: Any = None
     win32con: Any = None
     win32gui: Any = None
 
@@ -94,16 +94,11 @@ class TabOperationsTool:
 
                 if operation == "list":
                     # Get window title which usually contains filename
-                    window_text = self.controller.get_window_text(self.controller.hwnd)
+                    window_text = await call_win32(self.controller.get_window_text, self.controller.hwnd)
 
                     # Parse filename from window title
-                    # Notepad++ title format: "filename - Notepad++"
-                    filename = "Untitled"
-                    if " - Notepad++" in window_text:
-                        filename = window_text.split(" - Notepad++")[0]
-
-                    # Check if file is modified (usually indicated by *)
-                    is_modified = "*" in window_text
+                    # Notepad++ title format: "*filename - Notepad++" (* = modified)
+                    filename, is_modified = parse_window_title(window_text)
 
                     return {
                         "success": True,
@@ -145,20 +140,13 @@ class TabOperationsTool:
                         }
 
                     # Focus on Notepad++ window
-                    win32gui.SetForegroundWindow(self.controller.hwnd)
+                    await call_win32(win32gui.SetForegroundWindow, self.controller.hwnd)
                     await asyncio.sleep(0.1)
 
-                    # Send Ctrl+Tab to cycle through tabs
+                    # Send Ctrl+Tab to cycle through tabs (keyboard input goes to the foreground window)
                     # This is a simplified implementation - full tab switching would need plugin API
-                    keybd_event = win32api.keybd_event
-
-                    for _ in range(tab_index):
-                        keybd_event(win32con.VK_CONTROL, 0, 0, 0)
-                        keybd_event(win32con.VK_TAB, 0, 0, 0)
-                        await asyncio.sleep(0.1)
-                        keybd_event(win32con.VK_TAB, 0, win32con.KEYEVENTF_KEYUP, 0)
-                        keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
-                        await asyncio.sleep(0.2)
+                    # All presses go out as one SendInput batch; Ctrl is released after each Tab as before
+                    await call_win32(self.controller.send_chords, [(win32con.VK_CONTROL, win32con.VK_TAB)] * tab_index)
 
                     await asyncio.sleep(0.5)
 
@@ -180,7 +168,7 @@ class TabOperationsTool:
                 elif operation == "close":
                     # Guard: closing a dirty tab pops NPP's "Save file?" dialog and
                     # silently blocks the close unless the user allows discarding.
-                    tab_state = self.controller.get_active_tab_state()
+                    tab_state = await call_win32(self.controller.get_active_tab_state)
                     if tab_state["dirty"] and not discard:
                         return {
                             "success": False,
@@ -198,23 +186,22 @@ class TabOperationsTool:
                             ],
                             "context": tab_state,
                         }
-                    # Focus on Notepad++ window
-                    win32gui.SetForegroundWindow(self.controller.hwnd)
-                    await asyncio.sleep(0.1)
-
-                    # Send Ctrl+W to close tab (or Ctrl+F4)
-                    keybd_event = win32api.keybd_event
-                    keybd_event(win32con.VK_CONTROL, 0, 0, 0)
-                    keybd_event(ord("W"), 0, 0, 0)
-                    keybd_event(ord("W"), 0, win32con.KEYEVENTF_KEYUP, 0)
-                    keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
+                    # File > Close as a menu command (no focus or keystrokes needed)
+                    if not await call_win32(self.controller.close_current):
+                        return {
+                            "success": False,
+                            "error": "editor_unavailable",
+                            "operation": operation,
+                            "summary": "Could not reach the Notepad++ window - close aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
+                        }
 
                     await asyncio.sleep(0.4)
 
                     # If NPP popped the Save dialog, dismiss it deterministically (no = discard)
                     dismissed = False
-                    if self.controller.has_modal_dialog():
-                        dismissed = self.controller.dismiss_save_dialog("no")
+                    if await call_win32(self.controller.has_modal_dialog):
+                        dismissed = await call_win32(self.controller.dismiss_save_dialog, "no")
                         await asyncio.sleep(0.4)
 
                     tab_description = "current tab" if tab_index == -1 else f"tab {tab_index}"
@@ -229,7 +216,7 @@ class TabOperationsTool:
                             "Use file_ops new to open a new file if needed",
                         ],
                         "context": {
-                            "close_method": "keyboard_simulation",
+                            "close_method": "menu_command",
                             "unsaved_changes": "May prompt user if file has unsaved changes",
                         },
                     }
@@ -254,6 +241,7 @@ class TabOperationsTool:
                     "success": False,
                     "error": f"Tab operation failed: {e}",
                     "operation": operation,
+                    **win_error(e),
                     "summary": f"Tab operation '{operation}' encountered an error",
                     "recovery_options": [
                         "Check Notepad++ is running",
@@ -11,11 +11,14 @@ supported on NPP 8.x (Scintilla SETSEL is not serviced externally).
 """
 
 import re
+from itertools import islice
 from typing import Annotated, Any, Literal
 
 from fastmcp import FastMCP
 from pydantic import Field
 
+from .controller import call_win32, win_error
+
 # Windows-specific imports
 try:
     import win32api
@@ -170,8 +173,8 @@ class TextOperationsTool:
             Notes:
              - Missing text, no active document, or Windows API unavailable returns success=False with recovery_options.
              - write/insert guards return success=False with recovery options instead of touching a guarded buffer.
-             - Text transport needs the editor to come to the foreground; if that fails (e.g. locked session),
-               operations return success=False with a clear reason rather than faking success.
+             - Text transport uses the clipboard and Notepad++ menu commands (no foreground needed); if the
+               window cannot be reached, operations return success=False with a clear reason rather than faking success.
             """
             if not self.controller:
                 return {
@@ -188,12 +191,12 @@ class TextOperationsTool:
             try:
                 await self.controller.ensure_notepadpp_running()
 
-                state = self.controller.get_active_tab_state()
+                state = await call_win32(self.controller.get_active_tab_state)
 
                 if operation == "insert":
                     if not text:
                         return _missing_text(operation)
-                    buffer_len = self.controller.get_buffer_length()
+                    buffer_len = await call_win32(self.controller.get_buffer_length)
                     if buffer_len > 0 and not (state["untitled"] or edit_ok):
                         return {
                             "success": False,
@@ -211,19 +214,23 @@ class TextOperationsTool:
                             ],
                             "context": state,
                         }
-                    if not self.controller.insert_at_caret(text):
+                    if not await call_win32(self.controller.insert_at_caret, text):
                         return {
                             "success": False,
-                            "error": "foreground_unavailable",
+                            "error": "editor_unavailable",
                             "operation": operation,
-                            "summary": "Could not bring the editor to the foreground - insert aborted",
+                            "summary": "Could not reach the Notepad++ window - insert aborted",
                             "recovery_options": [
-                                "Bring Notepad++ to the foreground and retry",
+                                "Make sure Notepad++ is running and retry",
                                 "Run the MCP client from your interactive desktop session",
                             ],
                         }
                     # Verify: the caret insertion should be present in the LIVE buffer.
-                    live = self.controller.get_live_buffer_text().replace("\r\n", "\n").replace("\r", "\n")
+                    live = (
+                        (await call_win32(self.controller.get_live_buffer_text))
+                        .replace("\r\n", "\n")
+                        .replace("\r", "\n")
+                    )
                     if text not in live:
                         return {
                             "success": False,
@@ -245,17 +252,25 @@ class TextOperationsTool:
                 elif operation == "find":
                     if not text:
                         return _missing_text(operation)
-                    full, _source = self.controller.get_buffer_text()
+                    full, _source = await call_win32(self.controller.get_buffer_text)
                     flags = 0 if case_sensitive else re.IGNORECASE
-                    matches = [(m.start(), m.end()) for m in re.finditer(re.escape(text), full, flags)]
+                    pattern = re.compile(re.escape(text), flags)
+                    # Only the first 50 spans are reported; count the rest without building match tuples
+                    matches = pattern.finditer(full)
+                    positions = [m.span() for m in islice(matches, 50)]
+                    if case_sensitive:
+                        count = full.count(text)
+                    else:
+                        # Carry on from where the spans stopped, so the buffer is scanned once
+                        count = len(positions) + sum(1 for _ in matches)
                     return {
                         "success": True,
                         "operation": operation,
-                        "summary": f"Found {len(matches)} occurrence(s) of '{text}'",
+                        "summary": f"Found {count} occurrence(s) of '{text}'",
                         "result": {
-                            "count": len(matches),
-                            "positions": matches[:50],
-                            "total_matches": len(matches),
+                            "count": count,
+                            "positions": positions,
+                            "total_matches": count,
                             "source": _source,
                         },
                         "next_steps": [
@@ -268,7 +283,7 @@ class TextOperationsTool:
                 elif operation == "write":
                     if text is None:
                         return _missing_text(operation)
-                    buffer_len = self.controller.get_buffer_length()
+                    buffer_len = await call_win32(self.controller.get_buffer_length)
                     if buffer_len > 0 and not (state["untitled"] or force):
                         return {
                             "success": False,
@@ -286,18 +301,18 @@ class TextOperationsTool:
                             ],
                             "context": {**state, "buffer_length": buffer_len},
                         }
-                    if not self.controller.set_buffer_text(text):
+                    if not await call_win32(self.controller.set_buffer_text, text):
                         return {
                             "success": False,
-                            "error": "foreground_unavailable",
+                            "error": "editor_unavailable",
                             "operation": operation,
-                            "summary": "Could not bring the editor to the foreground - write aborted",
+                            "summary": "Could not reach the Notepad++ window - write aborted",
                             "recovery_options": [
-                                "Bring Notepad++ to the foreground and retry",
+                                "Make sure Notepad++ is running and retry",
                                 "Run the MCP client from your interactive desktop session",
                             ],
                         }
-                    if not self.controller.verify_buffer(text):
+                    if not await call_win32(self.controller.verify_buffer, text):
                         return {
                             "success": False,
                             "error": "verification_failed",
@@ -322,7 +337,7 @@ class TextOperationsTool:
                             "summary": "replace_all requires both text and replacement",
                             "recovery_options": ["Provide text (pattern) and replacement"],
                         }
-                    full, _source = self.controller.get_buffer_text()
+                    full, _source = await call_win32(self.controller.get_buffer_text)
                     if regex:
                         flags = 0 if case_sensitive else re.IGNORECASE
                         try:
@@ -348,15 +363,15 @@ class TextOperationsTool:
                             "summary": "No occurrences found - nothing to replace",
                             "result": {"replacements": 0, "changed": False},
                         }
-                    if not self.controller.set_buffer_text(new_text):
+                    if not await call_win32(self.controller.set_buffer_text, new_text):
                         return {
                             "success": False,
-                            "error": "foreground_unavailable",
+                            "error": "editor_unavailable",
                             "operation": operation,
-                            "summary": "Could not bring the editor to the foreground - replace aborted",
-                            "recovery_options": ["Bring Notepad++ to the foreground and retry"],
+                            "summary": "Could not reach the Notepad++ window - replace aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
                         }
-                    if not self.controller.verify_buffer(new_text):
+                    if not await call_win32(self.controller.verify_buffer, new_text):
                         return {
                             "success": False,
                             "error": "verification_failed",
@@ -382,28 +397,28 @@ class TextOperationsTool:
                             "summary": "goto_line requires a positive 1-based line number",
                             "recovery_options": ["Provide line >= 1"],
                         }
-                    self.controller.goto_line(line)
+                    await call_win32(self.controller.goto_line, line)
                     return {
                         "success": True,
                         "operation": operation,
                         "summary": f"Moved caret to line {line}",
                         "result": {
                             "line": line,
-                            "line_count": self.controller.get_line_count(),
-                            "caret": self.controller.get_caret(),
+                            "line_count": await call_win32(self.controller.get_line_count),
+                            "caret": await call_win32(self.controller.get_caret),
                         },
                     }
 
                 elif operation == "copy_selection":
-                    if not self.controller.copy_selection_to_clipboard():
+                    if not await call_win32(self.controller.copy_selection_to_clipboard):
                         return {
                             "success": False,
-                            "error": "foreground_unavailable",
+                            "error": "editor_unavailable",
                             "operation": operation,
-                            "summary": "Could not bring the editor to the foreground - copy aborted",
-                            "recovery_options": ["Bring Notepad++ to the foreground and retry"],
+                            "summary": "Could not reach the Notepad++ window - copy aborted",
+                            "recovery_options": ["Make sure Notepad++ is running and retry"],
                         }
-                    selected = self.controller._clipboard_get()
+                    selected = await call_win32(self.controller._clipboard_get)
                     return {
                         "success": True,
                         "operation": operation,
@@ -413,7 +428,7 @@ class TextOperationsTool:
                     }
 
                 elif operation == "comment_uncomment":
-                    full, _source = self.controller.get_buffer_text()
+                    full, _source = await call_win32(self.controller.get_buffer_text)
                     marker = _comment_char_for(state["filename"])
                     if mode in ("python", "js"):
                         marker = "#" if mode == "python" else "//"
@@ -432,13 +447,15 @@ class TextOperationsTool:
                             "result": {"changed_lines": 0, "marker": marker},
                         }
                     new_text = "\n".join(lines)
-                    if not self.controller.set_buffer_text(new_text) or not self.controller.verify_buffer(new_text):
+                    if not await call_win32(self.controller.set_buffer_text, new_text) or not await call_win32(
+                        self.controller.verify_buffer, new_text
+                    ):
                         return {
                             "success": False,
                             "error": "verification_failed",
                             "operation": operation,
                             "summary": "Comment toggle could not be applied",
-                            "recovery_options": ["Retry once", "Bring Notepad++ to the foreground"],
+                            "recovery_options": ["Retry once", "Make sure Notepad++ is running"],
                         }
                     return {
                         "success": True,
@@ -448,20 +465,22 @@ class TextOperationsTool:
                     }
 
                 elif operation == "case":
-                    full, _source = self.controller.get_buffer_text()
+                    full, _source = await call_win32(self.controller.get_buffer_text)
                     if mode == "upper":
                         new_text = full.upper()
                     elif mode == "lower":
                         new_text = full.lower()
                     else:
                         new_text = full.title()
-                    if not self.controller.set_buffer_text(new_text) or not self.controller.verify_buffer(new_text):
+                    if not await call_win32(self.controller.set_buffer_text, new_text) or not await call_win32(
+                        self.controller.verify_buffer, new_text
+                    ):
                         return {
                             "success": False,
                             "error": "verification_failed",
                             "operation": operation,
                             "summary": "Case conversion could not be applied",
-                            "recovery_options": ["Retry once", "Bring Notepad++ to the foreground"],
+                            "recovery_options": ["Retry once", "Make sure Notepad++ is running"],
                         }
                     return {
                         "success": True,
@@ -471,7 +490,7 @@ class TextOperationsTool:
                     }
 
                 elif operation == "trim":
-                    full, _source = self.controller.get_buffer_text()
+                    full, _source = await call_win32(self.controller.get_buffer_text)
                     trim_mode = mode or "all"
                     if trim_mode == "leading":
                         new_text = "\n".join(ln.lstrip() for ln in full.split("\n"))
@@ -479,13 +498,15 @@ class TextOperationsTool:
                         new_text = "\n".join(ln.rstrip() for ln in full.split("\n"))
                     else:
                         new_text = "\n".join(ln.strip() for ln in full.split("\n"))
-                    if not self.controller.set_buffer_text(new_text) or not self.controller.verify_buffer(new_text):
+                    if not await call_win32(self.controller.set_buffer_text, new_text) or not await call_win32(
+                        self.controller.verify_buffer, new_text
+                    ):
                         return {
                             "success": False,
                             "error": "verification_failed",
                             "operation": operation,
                             "summary": "Trim could not be applied",
-                            "recovery_options": ["Retry once", "Bring Notepad++ to the foreground"],
+                            "recovery_options": ["Retry once", "Make sure Notepad++ is running"],
                         }
                     return {
                         "success": True,
@@ -495,7 +516,7 @@ class TextOperationsTool:
                     }
 
                 elif operation == "line_ops":
-                    full, _source = self.controller.get_buffer_text()
+                    full, _source = await call_win32(self.controller.get_buffer_text)
                     lines = full.split("\n")
                     line_mode = mode or "sort"
                     if line_mode == "sort":
@@ -513,13 +534,15 @@ class TextOperationsTool:
                             "recovery_options": ["Use mode='sort' | 'join' | 'duplicate'"],
                         }
                     new_text = "\n".join(lines)
-                    if not self.controller.set_buffer_text(new_text) or not self.controller.verify_buffer(new_text):
+                    if not await call_win32(self.controller.set_buffer_text, new_text) or not await call_win32(
+                        self.controller.verify_buffer, new_text
+                    ):
                         return {
                             "success": False,
                             "error": "verification_failed",
                             "operation": operation,
                             "summary": "Line operation could not be applied",
-                            "recovery_options": ["Retry once", "Bring Notepad++ to the foreground"],
+                            "recovery_options": ["Retry once", "Make sure Notepad++ is running"],
                         }
                     return {
                         "success": True,
@@ -529,7 +552,7 @@ class TextOperationsTool:
                     }
 
                 elif operation == "count":
-                    full, _source = self.controller.get_buffer_text()
+                    full, _source = await call_win32(self.controller.get_buffer_text)
                     words = len(full.split()) if full.strip() else 0
                     occurrences = 0
                     if text:
@@ -567,6 +590,7 @@ class TextOperationsTool:
                     "success": False,
                     "error": f"Text operation failed: {e}",
                     "operation": operation,
+                    **win_error(e),
                     "summary": f"Text operation '{operation}' encountered an error",
                     "recovery_options": [
                         "Check Notepad++ is running",
@@ -9,12 +9,13 @@ Tests all the edge cases that could crash sync:
 - Permission issues
 """
 
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from notepadpp_mcp.file_validator import FileValidator, validate_markdown_file
+from notepadpp_mcp.file_validator import FileValidator, ValidationResult, validate_markdown_file
 
 
 @pytest.fixture
@@ -81,6 +82,29 @@ class TestWeirdFilenames:
         # The important thing is the reserved name check
         assert any("Reserved" in e or "does not exist" in e for e in result.errors)
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows cannot create these filenames")
+    def test_dangerous_and_control_chars(self, temp_dir):
+        """Test dangerous and control characters in real filenames."""
+        file_path = temp_dir / "a<b|c\x01.md"
+        file_path.write_text("# Odd name")
+
+        result = validate_markdown_file(file_path)
+
+        assert not result.is_valid
+        assert any("Dangerous characters" in e and "'<'" in e and "'|'" in e for e in result.errors)
+        assert any("Control characters" in e for e in result.errors)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows cannot create reserved filenames")
+    def test_reserved_name_prefix_is_allowed(self, temp_dir):
+        """Test reserved names match whole stems only, case-insensitively."""
+        reserved = temp_dir / "com1.md"
+        reserved.write_text("# Reserved")
+        prefixed = temp_dir / "COM1234.md"
+        prefixed.write_text("# Not reserved")
+
+        assert any("Reserved Windows filename: COM1" in e for e in validate_markdown_file(reserved).errors)
+        assert validate_markdown_file(prefixed).is_valid
+
 
 class TestEmptyAndSizeIssues:
     """Test handling of file size issues."""
@@ -181,6 +205,17 @@ class TestEncodingIssues:
         assert result.is_valid
         assert any("Mixed line endings" in w for w in result.warnings)
 
+    def test_crlf_content_normalized(self, temp_dir):
+        """Test CRLF files decode to LF content like a text-mode read."""
+        file_path = temp_dir / "crlf.md"
+        file_path.write_bytes("# Caf\xe9\r\nLine 2\r\n".encode("cp1252"))
+
+        result = validate_markdown_file(file_path)
+
+        assert result.is_valid
+        assert result.content == "# Café\nLine 2\n"
+        assert not any("Mixed line endings" in w for w in result.warnings)
+
 
 class TestFrontmatterIssues:
     """Test handling of broken frontmatter."""
@@ -261,6 +296,61 @@ bad: [syntax
         assert not result.is_valid
         assert any("YAML" in e or "frontmatter" in e.lower() for e in result.errors)
 
+    def test_frontmatter_loaded_eagerly(self, temp_dir):
+        """Test non-strict validation loads the frontmatter mapping."""
+        file_path = temp_dir / "front.md"
+        file_path.write_text("---\ntitle: Loaded\ncount: 3\n---\n\n# Content\n")
+
+        result = validate_markdown_file(file_path)
+
+        assert result.frontmatter == {"title": "Loaded", "count": 3}
+
+    @pytest.mark.parametrize(
+        "frontmatter",
+        ["a: 1\nc: *y", "a: 1\n--- # two\nb: 2"],
+        ids=["undefined-alias", "second-document"],
+    )
+    def test_composer_error_frontmatter_warns(self, temp_dir, frontmatter):
+        """Test YAML that parses but can't be composed is reported."""
+        file_path = temp_dir / "composer.md"
+        file_path.write_text(f"---\n{frontmatter}\n---\n\n# Content\n")
+
+        result = FileValidator().validate_file(file_path)
+
+        assert result.is_valid
+        assert any("Malformed frontmatter YAML" in w for w in result.warnings)
+        assert result.frontmatter is None
+
+    def test_unconstructible_frontmatter(self, temp_dir):
+        """Test well-formed YAML that can't be loaded doesn't crash either mode."""
+        file_path = temp_dir / "bad_tag.md"
+        file_path.write_text("---\ncount: !!int abc\n---\n\n# Content\n")
+
+        lenient = FileValidator().validate_file(file_path)
+        strict = FileValidator(strict_frontmatter=True).validate_file(file_path)
+
+        assert lenient.is_valid
+        assert any("Malformed frontmatter YAML" in w for w in lenient.warnings)
+        assert not strict.is_valid
+        assert any("Invalid YAML" in e for e in strict.errors)
+
+    def test_unknown_tag_frontmatter_warns(self, temp_dir):
+        """Test a tag SafeLoader can't construct is reported."""
+        file_path = temp_dir / "custom_tag.md"
+        file_path.write_text("---\ntitle: !custom x\n---\n\n# Content\n")
+
+        result = FileValidator().validate_file(file_path)
+
+        assert result.is_valid
+        assert any("Malformed frontmatter YAML" in w for w in result.warnings)
+        assert result.frontmatter is None
+
+    def test_frontmatter_constructor_argument(self):
+        """Test results can still be built with a frontmatter mapping."""
+        result = ValidationResult(is_valid=True, file_path="a.md", frontmatter={"title": "A"})
+
+        assert result.frontmatter == {"title": "A"}
+
     def test_no_frontmatter(self, temp_dir):
         """Test file without frontmatter is valid."""
         file_path = temp_dir / "no_front.md"
@@ -359,6 +449,140 @@ class TestBatchValidation:
         assert "**Total Files:** 3" in summary
         assert "Invalid:" in summary
 
+    def test_batch_parallel_matches_serial(self, temp_dir):
+        """Test parallel batch validation keeps input order and results."""
+        for i in range(20):
+            (temp_dir / f"file_{i:02d}.md").write_text(f"# File {i}")
+        (temp_dir / "binary.md").write_bytes(b"\x00\xff")
+
+        validator = FileValidator()
+        files = sorted(temp_dir.glob("*.md"))
+        serial = validator.validate_batch(files, parallel=False)
+        threaded = validator.validate_batch(files, workers=4)
+        processes = validator.validate_batch(files, workers=2, use_processes=True)
+
+        assert list(threaded) == list(serial) == list(processes)
+        assert [r.is_valid for r in threaded.values()] == [r.is_valid for r in serial.values()]
+        assert [r.is_valid for r in processes.values()] == [r.is_valid for r in serial.values()]
+
+    def test_batch_parallel_stop_on_error(self, temp_dir):
+        """Test parallel batch stops at the first invalid file in input order."""
+        files = []
+        for i in range(10):
+            file_path = temp_dir / f"file_{i}.md"
+            file_path.write_bytes(b"\x00" if i == 3 else b"# Valid")
+            files.append(file_path)
+
+        validator = FileValidator()
+        results = validator.validate_batch(files, on_error="stop", workers=2)
+
+        assert list(results) == [str(f) for f in files[:4]]
+        assert not results[str(files[3])].is_valid
+
+    def test_validate_dir(self, temp_dir):
+        """Test directory validation picks up markdown files recursively."""
+        (temp_dir / "top.md").write_text("# Top")
+        (temp_dir / "notes.txt").write_text("not markdown")
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "nested.markdown").write_text("# Nested")
+        (temp_dir / "sub" / "empty.md").write_text("")
+        (temp_dir / ".hidden").mkdir()
+        (temp_dir / ".hidden" / "skipped.md").write_text("# Hidden")
+
+        validator = FileValidator(allow_empty=False)
+        results = validator.validate_dir(temp_dir)
+
+        assert sorted(Path(p).name for p in results) == ["empty.md", "nested.markdown", "top.md"]
+        assert results[str(temp_dir / "top.md")].size_bytes == 5
+        assert not results[str(temp_dir / "sub" / "empty.md")].is_valid
+
+        shallow = validator.validate_dir(temp_dir, recursive=False)
+        assert list(shallow) == [str(temp_dir / "top.md")]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Symlinks need extra privileges on Windows")
+    def test_validate_dir_does_not_follow_directory_symlinks(self, temp_dir):
+        """Test a symlink loop does not repeat files or recurse."""
+        (temp_dir / "top.md").write_text("# Top")
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "nested.md").write_text("# Nested")
+        (temp_dir / "sub" / "loop").symlink_to("..", target_is_directory=True)
+        (temp_dir / "sub" / "again").symlink_to(temp_dir, target_is_directory=True)
+
+        results = FileValidator().validate_dir(temp_dir)
+
+        assert sorted(results) == sorted(str(p) for p in temp_dir.rglob("*.md"))
+        assert len(results) == 2
+
+
+class TestResultCache:
+    """Test the opt-in (mtime, size) result cache."""
+
+    def test_cache_disabled_by_default(self, temp_dir):
+        """Test validators revalidate every call unless caching is enabled."""
+        file_path = temp_dir / "note.md"
+        file_path.write_text("# Note")
+
+        validator = FileValidator()
+
+        assert validator.validate_file(file_path) is not validator.validate_file(file_path)
+        assert validator.get_cache_stats()["hits"] == 0
+
+    def test_cache_hit_and_change(self, temp_dir):
+        """Test unchanged files hit the cache and modified files are revalidated."""
+        file_path = temp_dir / "note.md"
+        file_path.write_text("# Note")
+
+        validator = FileValidator(cache=True)
+        first = validator.validate_file(file_path)
+
+        assert validator.validate_file(file_path) == first
+
+        file_path.write_text("# Note, now longer")
+        second = validator.validate_file(file_path)
+
+        assert second is not first
+        assert second.content == "# Note, now longer"
+        assert validator.get_cache_stats() == {"hits": 1, "misses": 2, "size": 1, "max_size": 10_000}
+
+    def test_cache_invalidate_and_eviction(self, temp_dir):
+        """Test explicit invalidation and least-recently-used eviction."""
+        files = [temp_dir / f"note{i}.md" for i in range(3)]
+        for file_path in files:
+            file_path.write_text("# Note")
+
+        validator = FileValidator(cache=True, cache_size=2)
+        validator.validate_batch(files, parallel=False)
+        assert validator.get_cache_stats()["size"] == 2
+
+        validator.validate_file(files[2])
+        misses = validator.get_cache_stats()["misses"]
+        validator.invalidate(files[2])
+        validator.validate_file(files[2])
+        assert validator.get_cache_stats()["misses"] == misses + 1
+
+        validator.invalidate()
+        assert validator.get_cache_stats()["size"] == 0
+
+    def test_cached_results_are_independent(self, temp_dir):
+        """Test changing a returned result doesn't change what later calls get."""
+        file_path = temp_dir / "note.md"
+        file_path.write_text("---\ntags: [a]\n---\n# Note")
+
+        validator = FileValidator(cache=True)
+        first = validator.validate_file(file_path)
+        first.add_error("caller error")
+        first.frontmatter["tags"].append("b")
+
+        second = validator.validate_file(file_path)
+        second.add_warning("caller warning")
+        third = validator.validate_file(file_path)
+
+        assert validator.get_cache_stats()["hits"] == 2
+        assert third.is_valid
+        assert third.errors == []
+        assert third.warnings == []
+        assert third.frontmatter == {"tags": ["a"]}
+
 
 class TestEdgeCases:
     """Test various edge cases."""
@@ -13,7 +13,7 @@ import time
 
 import pytest
 
-from notepadpp_mcp.link_parser import LinkParser, parse_links_safe
+from notepadpp_mcp.link_parser import HAS_RE2, Link, LinkParser, LinkParseResult, parse_links_safe
 
 
 class TestBasicLinkParsing:
@@ -95,6 +95,34 @@ Raw URL: https://example.com
         assert "image" in groups
         assert "url" in groups
 
+    def test_links_in_document_order(self):
+        """Test links come back in document order with images not double-counted."""
+        content = "![Alt](a.png) then [Text](b.md) then [[Wiki]] then ![](c.jpg)"
+
+        parser = LinkParser()
+        result = parser.parse_links(content)
+
+        assert [(link.type, link.target) for link in result.links] == [
+            ("image", "a.png"),
+            ("markdown", "b.md"),
+            ("wikilink", "Wiki"),
+            ("image", "c.jpg"),
+        ]
+        assert [link.start_pos for link in result.links] == sorted(link.start_pos for link in result.links)
+
+    @pytest.mark.skipif(not HAS_RE2, reason="google-re2 not installed")
+    def test_re2_engine_matches_re(self):
+        """Test the optional re2 engine finds the same links as re."""
+        content = "日本 [[Wiki|Shown]] ![Alt](a.png) [Café](http://café.com) https://example.com/x"
+
+        expected = LinkParser(extract_urls=True).parse_links(content)
+        result = LinkParser(extract_urls=True, use_re2=True).parse_links(content)
+
+        assert result.is_valid
+        assert [(link.type, link.target, link.text, link.start_pos, link.end_pos) for link in result.links] == [
+            (link.type, link.target, link.text, link.start_pos, link.end_pos) for link in expected.links
+        ]
+
 
 class TestLargeContent:
     """Test handling of very large content."""
@@ -149,6 +177,17 @@ class TestLargeContent:
         assert not result.is_valid
         assert any("too large" in e.lower() for e in result.errors)
 
+    def test_content_size_limit_counts_utf8_bytes(self):
+        """Test the size limit applies to encoded bytes, not characters."""
+        content = "日" * 400  # 400 chars, 1200 UTF-8 bytes
+
+        parser = LinkParser(max_content_size=1000)
+
+        assert not parser.parse_links(content).is_valid
+        assert parser.parse_links(content[:300]).is_valid
+        # A caller that already knows the byte size skips the measurement
+        assert not parser.parse_links("[[Link]]", content_size=2000).is_valid
+
 
 class TestMalformedLinks:
     """Test handling of malformed link syntax."""
@@ -275,6 +314,17 @@ class TestPerformance:
         # Should either complete or timeout, but not hang
         assert result.is_valid or any("timeout" in e.lower() for e in result.errors)
 
+    def test_timeout_fires(self):
+        """Test an exceeded time budget stops parsing with a timeout error."""
+        content = "[[Page]] " * 5000
+
+        parser = LinkParser(max_parse_time=0.0)
+        result = parser.parse_links(content)
+
+        assert not result.is_valid
+        assert any("timeout" in e.lower() for e in result.errors)
+        assert result.link_count < 5000
+
     def test_small_file_performance(self):
         """Test that small files parse quickly."""
         content = "# Test\n\nSome text with [[Link1]] and [Link2](url)."
@@ -335,6 +385,41 @@ https://example.com
         assert "image" in groups
         assert len(groups["wikilink"]) == 1
 
+    def test_link_columns(self):
+        """Test the per-attribute columns line up with the Link objects."""
+        content = "[[Page|Shown]] [Text](b.md) [[Page]] https://example.com"
+
+        parser = LinkParser(extract_urls=True)
+        result = parser.parse_links(content)
+
+        assert result.link_count == 4
+        assert result.types == ["wikilink", "markdown", "wikilink", "url"]
+        assert result.targets == ["Page", "b.md", "Page", "https://example.com"]
+        assert result.texts == ["Shown", "Text", None, None]
+        assert [(link.start_pos, link.end_pos) for link in result.links] == list(
+            zip(result.starts, result.ends, strict=True)
+        )
+        assert [link.raw for link in result.links][:2] == ["[[Page|Shown]]", "[Text](b.md)"]
+        assert parser.extract_unique_targets(result) == {"Page", "b.md", "https://example.com"}
+
+    def test_links_snapshot_follows_add_link(self):
+        """Test result.links is reused between accesses and extended by add_link()."""
+        result = LinkParser().parse_links("[[A]] [[B]]")
+
+        assert result.links is result.links
+        assert isinstance(result.links, tuple)
+        result.add_link("url", "https://example.com", None, 0, 0)
+
+        assert [link.target for link in result.links] == ["A", "B", "https://example.com"]
+        assert result.link_count == 3
+
+    def test_from_links(self):
+        """Test results can be built from a list of Link objects."""
+        result = LinkParseResult.from_links(True, "[[A]]", [Link(type="wikilink", target="A", end_pos=5)])
+
+        assert result.targets == ["A"]
+        assert result.links[0].raw == "[[A]]"
+
 
 class TestSafeWrapper:
     """Test safe parsing wrapper."""
@@ -356,7 +441,7 @@ class TestSafeWrapper:
         result = parse_links_safe(content)
 
         # Should not crash, returns result with errors
-        assert isinstance(result.links, list)
+        assert isinstance(result.links, tuple)
 
 
 class TestEdgeCases:
@@ -8,11 +8,14 @@ advanced-memory-mcp where the watchdog failed to start.
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from notepadpp_mcp.sync_health import REPORT_CACHE_TTL, SyncHealthMonitor, SyncState
+
 # Paths that are guaranteed not to exist (Windows resolves drive-root-relative
 # paths like "/nonexistent" against the current drive, which may exist).
 _NONEXISTENT = str(Path(tempfile.gettempdir()) / f"npp-no-such-dir-{os.getpid()}-{time.time_ns()}")
@@ -330,6 +333,84 @@ class TestSyncMonitoring:
         assert progress_log[-1] == 100.0
 
 
+class TestSyncHealthMonitor:
+    """Test the real SyncHealthMonitor against on-disk trees."""
+
+    def test_count_sees_changes_below_the_root(self, temp_project):
+        """Test files added in nested directories are counted on the next call."""
+        monitor = SyncHealthMonitor(str(temp_project))
+        assert monitor.count_files() == 80
+
+        (temp_project / "notes" / "deep").mkdir()
+        (temp_project / "notes" / "deep" / "new.md").write_text("# New")
+        (temp_project / "archive" / "new2.md").write_text("# New 2")
+
+        assert monitor.count_files() == 82
+        assert monitor.count_files() == len(list(temp_project.rglob("*.md")))
+
+    async def test_recovery_walks_the_tree_once(self, temp_project):
+        """Test recovery hands its fresh count to start_scan instead of counting again."""
+        monitor = SyncHealthMonitor(str(temp_project))
+        (temp_project / "notes" / "later.md").write_text("# Later")
+
+        with patch.object(monitor, "count_files", wraps=monitor.count_files) as mock_count:
+            await monitor._attempt_recovery()
+
+        assert mock_count.call_count == 1
+        assert monitor.metrics.files_total == 81
+        assert monitor.state == SyncState.SCANNING
+
+    def test_count_walks_many_subdirectories_in_parallel(self, temp_project):
+        """Test a root with enough subdirectories for the thread pool counts like rglob."""
+        for i in range(12):
+            nested = temp_project / f"topic_{i}" / "deep"
+            nested.mkdir(parents=True)
+            (nested / "a.md").write_text("# A")
+            (nested.parent / "b.md").write_text("# B")
+            (nested.parent / "skip.txt").write_text("not markdown")
+        (temp_project / "root.md").write_text("# Root")
+
+        monitor = SyncHealthMonitor(str(temp_project))
+
+        with patch("notepadpp_mcp.sync_health.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+            count = monitor.count_files()
+
+        mock_pool.assert_called_once()
+        assert count == len(list(temp_project.rglob("*.md"))) == 80 + 24 + 1
+
+    def test_health_report_reused_until_state_changes(self, temp_project):
+        """Test polls inside the TTL share one report; a state change or error rebuilds it."""
+        monitor = SyncHealthMonitor(str(temp_project))
+        monitor.start_scan()
+
+        report = monitor.get_health_report()
+        assert monitor.get_health_report() is report
+
+        monitor.update_scan_progress(10)
+        progressed = monitor.get_health_report()
+        assert progressed is not report
+        assert progressed["metrics"]["files_scanned"] == 10
+
+        monitor.state = SyncState.STALLED
+        stalled = monitor.get_health_report()
+        assert stalled is not progressed
+        assert stalled["healthy"] is False
+
+        monitor._add_error("permission_denied", "denied")
+        with_error = monitor.get_health_report()
+        assert with_error is not stalled
+        assert with_error["errors"][-1]["message"] == "denied"
+
+    def test_health_report_rebuilt_after_ttl(self, temp_project):
+        """Test an unchanged report is rebuilt once REPORT_CACHE_TTL has passed."""
+        monitor = SyncHealthMonitor(str(temp_project))
+        report = monitor.get_health_report()
+
+        later = time.monotonic() + REPORT_CACHE_TTL + 1
+        with patch("notepadpp_mcp.sync_health.time.monotonic", return_value=later):
+            assert monitor.get_health_report() is not report
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure custom markers."""